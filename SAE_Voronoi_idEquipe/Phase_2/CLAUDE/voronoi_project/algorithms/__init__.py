@@ -1,5 +1,5 @@
-from algorithms.delaunay import bowyer_watson
+from algorithms.delaunay import bowyer_watson, triangulate
 from algorithms.voronoi import compute_voronoi
 from algorithms.clipping import sutherland_hodgman
 
-__all__ = ["bowyer_watson", "compute_voronoi", "sutherland_hodgman"]
+__all__ = ["bowyer_watson", "triangulate", "compute_voronoi", "sutherland_hodgman"]
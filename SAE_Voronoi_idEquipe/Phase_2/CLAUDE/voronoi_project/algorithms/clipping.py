@@ -7,48 +7,56 @@ Clippe un polygone quelconque sur un rectangle axe-aligné.
 from geometry.primitives import EPS
 
 
-def _clip_half_plane(
-    polygon: list[tuple],
-    inside_fn,
-    intersect_fn,
-) -> list[tuple]:
-    """Étape générique : garde la partie du polygone du côté 'inside'."""
-    if not polygon:
-        return []
-
-    output = []
-    n = len(polygon)
-
-    for idx in range(n):
-        cur = polygon[idx]
-        prev = polygon[(idx - 1) % n]
-
-        if inside_fn(cur):
-            if not inside_fn(prev):
-                output.append(intersect_fn(prev, cur))
-            output.append(cur)
-        elif inside_fn(prev):
-            output.append(intersect_fn(prev, cur))
-
-    return output
-
-
-def _intersect_vertical(p1: tuple, p2: tuple, x: float) -> tuple:
-    """Intersection du segment [p1,p2] avec la droite verticale x=x."""
-    dx = p2[0] - p1[0]
-    if abs(dx) < EPS:
-        return (x, p1[1])
-    t = (x - p1[0]) / dx
-    return (x, p1[1] + t * (p2[1] - p1[1]))
-
-
-def _intersect_horizontal(p1: tuple, p2: tuple, y: float) -> tuple:
-    """Intersection du segment [p1,p2] avec la droite horizontale y=y."""
-    dy = p2[1] - p1[1]
-    if abs(dy) < EPS:
-        return (p1[0], y)
-    t = (y - p1[1]) / dy
-    return (p1[0] + t * (p2[0] - p1[0]), y)
+def _clip_x(src: list[tuple], dst: list[tuple], x: float, sign: float) -> list[tuple]:
+    """
+    Passe contre la droite verticale x = `x` : garde le côté x ≥ `x`
+    (sign = 1) ou x ≤ `x` (sign = -1). Écrit le résultat dans `dst`.
+    """
+    dst.clear()
+    if not src:
+        return dst
+
+    px, py = src[-1]
+    prev_in = (px - x) * sign >= 0.0
+    for cur in src:
+        cx, cy = cur
+        cur_in = (cx - x) * sign >= 0.0
+        if cur_in != prev_in:
+            dx = cx - px
+            if abs(dx) < EPS:
+                dst.append((x, py))
+            else:
+                dst.append((x, py + (x - px) / dx * (cy - py)))
+        if cur_in:
+            dst.append(cur)
+        px, py, prev_in = cx, cy, cur_in
+    return dst
+
+
+def _clip_y(src: list[tuple], dst: list[tuple], y: float, sign: float) -> list[tuple]:
+    """
+    Passe contre la droite horizontale y = `y` : garde le côté y ≥ `y`
+    (sign = 1) ou y ≤ `y` (sign = -1). Écrit le résultat dans `dst`.
+    """
+    dst.clear()
+    if not src:
+        return dst
+
+    px, py = src[-1]
+    prev_in = (py - y) * sign >= 0.0
+    for cur in src:
+        cx, cy = cur
+        cur_in = (cy - y) * sign >= 0.0
+        if cur_in != prev_in:
+            dy = cy - py
+            if abs(dy) < EPS:
+                dst.append((px, y))
+            else:
+                dst.append((px + (y - py) / dy * (cx - px), y))
+        if cur_in:
+            dst.append(cur)
+        px, py, prev_in = cx, cy, cur_in
+    return dst
 
 
 def sutherland_hodgman(
@@ -61,6 +69,11 @@ def sutherland_hodgman(
     """
     Clippe un polygone sur un rectangle [xmin, xmax] × [ymin, ymax].
 
+    Les bords étant axe-alignés, chaque passe est spécialisée (`_clip_x`,
+    `_clip_y`) : test d'appartenance sur une seule coordonnée et
+    intersection par une interpolation linéaire. Deux listes servent de
+    tampons alternés pour les quatre passes.
+
     Args:
         polygon: liste de sommets (x, y).
         xmin, xmax, ymin, ymax: bornes du rectangle de clipping.
@@ -68,18 +81,10 @@ def sutherland_hodgman(
     Returns:
         Liste des sommets du polygone clippé (peut être vide).
     """
-    poly = polygon[:]
+    buf_a: list[tuple] = []
+    buf_b: list[tuple] = []
 
-    poly = _clip_half_plane(poly,
-                            lambda p: p[0] >= xmin,
-                            lambda a, b: _intersect_vertical(a, b, xmin))
-    poly = _clip_half_plane(poly,
-                            lambda p: p[0] <= xmax,
-                            lambda a, b: _intersect_vertical(a, b, xmax))
-    poly = _clip_half_plane(poly,
-                            lambda p: p[1] >= ymin,
-                            lambda a, b: _intersect_horizontal(a, b, ymin))
-    poly = _clip_half_plane(poly,
-                            lambda p: p[1] <= ymax,
-                            lambda a, b: _intersect_horizontal(a, b, ymax))
-    return poly
+    _clip_x(polygon, buf_a, xmin, 1.0)
+    _clip_x(buf_a, buf_b, xmax, -1.0)
+    _clip_y(buf_b, buf_a, ymin, 1.0)
+    return _clip_y(buf_a, buf_b, ymax, -1.0)
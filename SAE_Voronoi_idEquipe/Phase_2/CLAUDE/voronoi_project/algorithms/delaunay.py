@@ -3,11 +3,40 @@ Triangulation de Delaunay par l'algorithme incrémental de Bowyer-Watson.
 
 Complexité : O(n²) en moyenne, O(n³) dans le pire cas.
 Référence   : Bowyer (1981), Watson (1981).
+
+Représentation interne (SoA) : les sommets sont indexés dans un tableau
+`coords` (N+3, 2) — les 3 derniers sont ceux du super-triangle — et la
+triangulation est un tableau d'indices `tri` (M, 3) accompagné de ses
+cercles circonscrits `cc` (M, 2) et `cr2` (M,). Les objets Triangle ne
+sont construits qu'en sortie.
+
+La boucle d'insertion (`_bowyer_watson_walk`) localise chaque point par une
+marche sur les voisinages puis explore la cavité en largeur : O(n log n) en
+pratique au lieu d'un balayage O(n) par insertion. Si numba est installé
+elle est compilée en un seul noyau natif, sinon elle s'exécute en Python
+pur. La version NumPy (balayage vectorisé + prédicats exacts) sert de
+repli pour les configurations dégénérées.
 """
 
-from geometry.primitives import edge_equal
+from collections import Counter
+
+import numpy as np
+
+from geometry.primitives import EPS, orient2d, incircle_adaptive
 from geometry.triangle import Triangle
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # numba est optionnel : le noyau reste du Python pur
+    _HAS_NUMBA = False
+
+    def njit(*_args, **_kwargs):
+        return lambda fn: fn
+
+# Taille à partir de laquelle triangulate(points, fast=None) délègue à Qhull
+FAST_THRESHOLD = 64
+
 
 def bowyer_watson(points: list[tuple]) -> list[Triangle]:
     """
@@ -15,7 +44,7 @@ def bowyer_watson(points: list[tuple]) -> list[Triangle]:
 
     Principe :
       1. Initialiser avec un super-triangle englobant tous les points.
-      2. Pour chaque point :
+      2. Pour chaque point (dans l'ordre de Morton, voir `_morton_order`) :
          a. Trouver les triangles dont le cercle circonscrit contient le point.
          b. Identifier le polygone frontalier (arêtes non partagées).
          c. Supprimer les mauvais triangles et retrianguler le trou.
@@ -25,38 +54,320 @@ def bowyer_watson(points: list[tuple]) -> list[Triangle]:
         points: liste de tuples (x, y). Doit contenir au moins 3 points.
 
     Returns:
-        Liste de Triangle formant la triangulation de Delaunay.
-        Retourne [] si moins de 3 points.
+        Liste de Triangle formant la triangulation de Delaunay ; chaque
+        triangle porte les indices de ses sommets dans `points`
+        (`Triangle.indices`). Retourne [] si moins de 3 points.
     """
     if len(points) < 3:
         return []
 
-    super_triangle = _build_super_triangle(points)
-    triangulation = [super_triangle]
-    super_verts = (super_triangle.a, super_triangle.b, super_triangle.c)
+    # Un seul tableau float64 partagé : les n sites (ordre de Morton) puis
+    # les 3 sommets du super-triangle. Tout le calcul se fait ensuite sur
+    # des indices entiers dans ce tableau. Les doublons exacts ne sont pas
+    # insérés : seule la première occurrence porte les triangles.
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    keep = np.sort(np.unique(pts, axis=0, return_index=True)[1])
+    if len(keep) < 3:
+        return []
+    order = keep[_morton_order(pts[keep])]
+    n = len(order)
+    coords = np.concatenate((pts[order], _build_super_triangle(pts)))
+
+    tri, ok = _bowyer_watson_walk(coords, n)
+    if not ok:
+        tri = _bowyer_watson_np(coords, n)
 
-    for point in points:
-        bad_triangles = _find_bad_triangles(point, triangulation)
-        boundary = _find_boundary(bad_triangles)
+    # Les indices internes (ordre de Morton) sont ramenés aux indices de
+    # `points` : l'identité d'un sommet est un entier, jamais une
+    # comparaison flottante.
+    tri = tri[(tri < n).all(axis=1)]
+    return _make_triangles(points, pts, order[tri])
 
-        for tri in bad_triangles:
-            triangulation.remove(tri)
 
-        for edge in boundary:
-            triangulation.append(Triangle(edge[0], edge[1], point))
+def triangulate(points: list[tuple], *, fast: bool | None = False) -> list[Triangle]:
+    """
+    Triangulation de Delaunay avec choix du moteur.
+
+    Args:
+        points: liste de tuples (x, y).
+        fast  : si True, utilise `scipy.spatial.Delaunay` (Qhull, en C) quand
+                scipy est installé ; sinon, ou si False, `bowyer_watson`
+                (implémentation de référence). None : choix automatique,
+                Qhull dès FAST_THRESHOLD points.
 
-    return [t for t in triangulation if not t.has_supervertex(super_verts)]
+    Returns:
+        Liste de Triangle, au même format que `bowyer_watson`.
+    """
+    if fast is None:
+        fast = len(points) >= FAST_THRESHOLD
+    if fast and len(points) >= 3:
+        try:
+            from scipy.spatial import Delaunay as _Qhull
+        except ImportError:  # scipy est optionnel
+            _Qhull = None
+        if _Qhull is not None:
+            pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+            return _make_triangles(points, pts, _Qhull(pts).simplices.astype(np.int64))
+    return bowyer_watson(points)
 
 
 # ── Helpers privés ────────────────────────────────────────────────────────────
 
-def _build_super_triangle(points: list[tuple]) -> Triangle:
-    """Construit un super-triangle englobant largement tous les points."""
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
+def _make_triangles(
+    points: list[tuple],
+    pts: np.ndarray,
+    ids: np.ndarray,
+) -> list[Triangle]:
+    """
+    Construit les objets Triangle à partir des indices (M, 3) dans `points`.
+
+    Les cercles circonscrits sont calculés en un lot et transmis aux
+    objets Triangle (pas de recalcul scalaire en aval).
+    """
+    cc, cr2 = _circumcircles(pts, ids)
+    verts = points if isinstance(points, list) else list(map(tuple, pts.tolist()))
+    return [
+        Triangle(verts[ia], verts[ib], verts[ic], (ux, uy), r2, (ia, ib, ic))
+        for (ia, ib, ic), (ux, uy), r2
+        in zip(ids.tolist(), cc.tolist(), cr2.tolist())
+    ]
+
+
+def _bowyer_watson_np(coords: np.ndarray, n: int) -> np.ndarray:
+    """
+    Boucle d'insertion en NumPy : insère les n premiers sommets de `coords`
+    dans le super-triangle formé par les 3 derniers.
+
+    Les tableaux sont préalloués pour 2n+1 triangles (taille finale d'une
+    triangulation de n points + super-triangle) et remplis jusqu'au
+    compteur `m` ; ils ne doublent de taille qu'en cas de dépassement.
+
+    Returns:
+        Tableau (M, 3) d'indices de tous les triangles (super-triangle inclus).
+    """
+    cap = 2 * n + 1
+    tri = np.zeros((cap, 3), dtype=np.int64)
+    cc = np.zeros((cap, 2))
+    cr2 = np.zeros(cap)
+    alive = np.zeros(cap, dtype=bool)
+
+    tri[0] = (n, n + 1, n + 2)
+    cc[:1], cr2[:1] = _circumcircles(coords, tri[:1])
+    alive[0] = True
+    m = 1
+    n_dead = 0
+
+    for i in range(n):
+        px, py = coords[i].tolist()
+        bad = _find_bad_triangles(px, py, coords, tri[:m], cc[:m], cr2[:m], alive[:m])
+        boundary = _find_boundary(tri[bad])
+
+        new_tri = np.array([(u, v, i) for u, v in boundary], dtype=np.int64)
+        new_tri = new_tri.reshape(-1, 3)
+        new_cc, new_cr2 = _circumcircles(coords, new_tri)
+
+        # Suppression = alive[k] = False ; les nouveaux triangles réutilisent
+        # d'abord les emplacements libérés, le surplus est écrit après `m`.
+        alive[bad] = False
+        slots = bad[:len(new_tri)]
+        k = len(slots)
+        tri[slots], cc[slots], cr2[slots] = new_tri[:k], new_cc[:k], new_cr2[:k]
+        alive[slots] = True
+        n_dead += len(bad) - k
+
+        extra = len(new_tri) - k
+        if m + extra > cap:
+            cap = max(2 * cap, m + extra)
+            tri, cc, cr2, alive = (_grow(a, cap) for a in (tri, cc, cr2, alive))
+        tri[m:m + extra] = new_tri[k:]
+        cc[m:m + extra] = new_cc[k:]
+        cr2[m:m + extra] = new_cr2[k:]
+        alive[m:m + extra] = True
+        m += extra
+
+        # Compactage occasionnel si les emplacements morts dominent
+        if n_dead > m // 2:
+            keep = np.flatnonzero(alive[:m])
+            size = len(keep)
+            tri[:size], cc[:size], cr2[:size] = tri[keep], cc[keep], cr2[keep]
+            alive[:size] = True
+            alive[size:m] = False
+            m = size
+            n_dead = 0
+
+    return tri[:m][alive[:m]]
+
+
+def _grow(arr: np.ndarray, cap: int) -> np.ndarray:
+    """Copie `arr` dans un tableau de `cap` lignes (complété par des zéros)."""
+    out = np.zeros((cap,) + arr.shape[1:], dtype=arr.dtype)
+    out[:len(arr)] = arr
+    return out
+
+
+@njit(cache=True)
+def _bowyer_watson_walk(coords, n):
+    """
+    Même boucle que `_bowyer_watson_np` (compilée par numba si disponible),
+    sans balayage de tous les triangles à chaque insertion.
+
+    Chaque triangle (anti-horaire) connaît ses 3 voisins : nbr[t, e] est le
+    triangle de l'autre côté de l'arête (tri[t, e], tri[t, e+1]), -1 sinon.
+    Pour insérer p :
+      1. Localisation par marche : depuis le dernier triangle créé, on
+         traverse l'arête dont p est strictement à droite jusqu'au triangle
+         qui contient p (court grâce à l'ordre de Morton).
+      2. Parcours en largeur depuis ce triangle : seuls les voisins dont le
+         cercle contient p rejoignent la cavité ; les autres bordent le trou.
+      3. Les |bad| + 2 nouveaux triangles réutilisent les emplacements des
+         mauvais (tableau (2n+1, 3) alloué une fois) et sont recousus entre
+         eux et à leurs voisins extérieurs.
+
+    Returns:
+        (tri, ok) : ok vaut False si un triangle plat est rencontré (il
+        exige les prédicats exacts) ou si la marche échoue ; l'appelant
+        repasse alors par NumPy.
+    """
+    cap = 2 * n + 1
+    tri = np.empty((cap, 3), np.int64)
+    nbr = np.empty((cap, 3), np.int64)
+    cc = np.empty((cap, 2))
+    cr2 = np.empty(cap)
+    mark = np.zeros(cap, np.int64)
+    bad = np.empty(cap, np.int64)
+    edges = np.empty((cap + 2, 3), np.int64)      # (u, v, voisin extérieur)
+    new = np.empty(cap + 2, np.int64)
+    first = np.empty(n + 3, np.int64)             # nouveau triangle (s, ·, p)
+    last = np.empty(n + 3, np.int64)              # nouveau triangle (·, s, p)
+
+    # Super-triangle (S1, S3, S2) : orientation anti-horaire
+    tri[0, 0], tri[0, 1], tri[0, 2] = n, n + 2, n + 1
+    nbr[0, 0] = nbr[0, 1] = nbr[0, 2] = -1
+    _circumcircle_nb(coords, tri, 0, cc, cr2)
+    m = 1
+    start = 0
+
+    for i in range(n):
+        px, py = coords[i, 0], coords[i, 1]
+        stamp = i + 1
+
+        # 1. Marche vers le triangle contenant p
+        t = start
+        steps = 0
+        moved = True
+        while moved:
+            moved = False
+            for e in range(3):
+                a, b = tri[t, e], tri[t, (e + 1) % 3]
+                ax, ay = coords[a, 0], coords[a, 1]
+                if (coords[b, 0] - ax) * (py - ay) - (coords[b, 1] - ay) * (px - ax) < 0.0:
+                    t = nbr[t, e]
+                    moved = True
+                    break
+            steps += 1
+            if t < 0 or steps > m:
+                return tri[:0], False
 
-    mn_x, mx_x = min(xs), max(xs)
-    mn_y, mx_y = min(ys), max(ys)
+        # 2. Cavité : parcours en largeur sur les voisins en conflit
+        if np.isinf(cr2[t]):
+            return tri[:0], False
+        dx = cc[t, 0] - px
+        dy = cc[t, 1] - py
+        if not dx * dx + dy * dy < cr2[t] - EPS:
+            return tri[:0], False                 # point confondu avec un sommet
+        bad[0] = t
+        mark[t] = stamp
+        nb = 1
+        ne = 0
+        head = 0
+        while head < nb:
+            t = bad[head]
+            head += 1
+            for e in range(3):
+                o = nbr[t, e]
+                if o >= 0 and mark[o] == stamp:
+                    continue
+                inside = False
+                if o >= 0:
+                    if np.isinf(cr2[o]):
+                        return tri[:0], False
+                    dx = cc[o, 0] - px
+                    dy = cc[o, 1] - py
+                    inside = dx * dx + dy * dy < cr2[o] - EPS
+                if inside:
+                    mark[o] = stamp
+                    bad[nb] = o
+                    nb += 1
+                else:
+                    if ne == cap + 2:
+                        return tri[:0], False
+                    edges[ne, 0] = tri[t, e]
+                    edges[ne, 1] = tri[t, (e + 1) % 3]
+                    edges[ne, 2] = o
+                    ne += 1
+
+        if ne != nb + 2:
+            return tri[:0], False
+
+        # 3. Retriangulation du trou et recollage des voisinages
+        for e in range(ne):
+            if e < nb:
+                slot = bad[e]
+            else:
+                slot = m
+                m += 1
+            u, v, o = edges[e, 0], edges[e, 1], edges[e, 2]
+            tri[slot, 0], tri[slot, 1], tri[slot, 2] = u, v, i
+            _circumcircle_nb(coords, tri, slot, cc, cr2)
+            nbr[slot, 0] = o
+            if o >= 0:
+                for f in range(3):
+                    if tri[o, f] == v and tri[o, (f + 1) % 3] == u:
+                        nbr[o, f] = slot
+            new[e] = slot
+            first[u] = slot
+            last[v] = slot
+
+        for e in range(ne):
+            slot = new[e]
+            nbr[slot, 1] = first[edges[e, 1]]     # arête (v, p)
+            nbr[slot, 2] = last[edges[e, 0]]      # arête (p, u)
+        start = new[0]
+
+    return tri[:m], True
+
+
+@njit(cache=True)
+def _circumcircle_nb(coords, tri, k, cc, cr2):
+    """
+    Cercle circonscrit du triangle k, écrit dans cc[k] / cr2[k] (même
+    formule que `_circumcircles`, dans le repère centré sur a).
+    """
+    ax, ay = coords[tri[k, 0], 0], coords[tri[k, 0], 1]
+    bx, by = coords[tri[k, 1], 0] - ax, coords[tri[k, 1], 1] - ay
+    cx, cy = coords[tri[k, 2], 0] - ax, coords[tri[k, 2], 1] - ay
+
+    D = 2.0 * (bx * cy - by * cx)
+    if abs(D) < EPS:
+        cc[k, 0] = cc[k, 1] = cr2[k] = np.inf
+        return
+
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+
+    ux = (cy * b2 - by * c2) / D
+    uy = (bx * c2 - cx * b2) / D
+    cc[k, 0], cc[k, 1] = ux + ax, uy + ay
+    cr2[k] = ux * ux + uy * uy
+
+
+def _build_super_triangle(pts: np.ndarray) -> np.ndarray:
+    """
+    Retourne les 3 sommets (S1, S2, S3) d'un super-triangle englobant tous
+    les points, sous forme d'un tableau (3, 2).
+    """
+    mn_x, mn_y = pts.min(axis=0).tolist()
+    mx_x, mx_y = pts.max(axis=0).tolist()
 
     dx = mx_x - mn_x or 1.0
     dy = mx_y - mn_y or 1.0
@@ -69,33 +380,119 @@ def _build_super_triangle(points: list[tuple]) -> Triangle:
     S2 = (mid_x,                mid_y + 2.0 * delta)
     S3 = (mid_x + 2.0 * delta,  mid_y - delta)
 
-    return Triangle(S1, S2, S3)
+    return np.array((S1, S2, S3), dtype=np.float64)
+
+
+def _morton_key(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Entrelace les bits de x et y (courbe en Z, 21 bits par coordonnée).
+    Vectorisé : x et y sont des tableaux uint64.
+    """
+    def spread(v: np.ndarray) -> np.ndarray:
+        v = (v | (v << 16)) & 0x0000FFFF0000FFFF
+        v = (v | (v << 8))  & 0x00FF00FF00FF00FF
+        v = (v | (v << 4))  & 0x0F0F0F0F0F0F0F0F
+        v = (v | (v << 2))  & 0x3333333333333333
+        v = (v | (v << 1))  & 0x5555555555555555
+        return v
+
+    return spread(x) | (spread(y) << 1)
+
+
+def _morton_order(pts: np.ndarray) -> np.ndarray:
+    """
+    Retourne les indices des points triés selon la courbe de Morton (Z-order).
+
+    Deux points consécutifs sont proches dans le plan : chaque insertion
+    réutilise la zone retriangulée par la précédente, ce qui garde les
+    cavités petites (l'ordre utilisateur peut être quelconque).
+    """
+    mn = pts.min(axis=0)
+    span = float((pts.max(axis=0) - mn).max()) or 1.0
+    scale = ((1 << 21) - 1) / span
+
+    q = ((pts - mn) * scale).astype(np.uint64)
+    return np.argsort(_morton_key(q[:, 0], q[:, 1]), kind="stable")
+
+
+def _circumcircles(
+    coords: np.ndarray,
+    tri: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calcule en un seul passage vectorisé les cercles circonscrits de tous
+    les triangles `tri` (même formule que Triangle._compute_circumcircle :
+    coordonnées relatives au sommet a, puis translation du centre).
+
+    Formule fermée (Cramer) plutôt que `np.linalg.solve` par lot : plus
+    rapide, et sans matrices singulières à masquer.
+
+    Returns:
+        (cc, cr2) : centres (M, 2) et rayons² (M,). Les triangles
+        dégénérés (|D| < EPS) reçoivent un centre et un rayon infinis.
+    """
+    ax, ay = coords[tri[:, 0], 0], coords[tri[:, 0], 1]
+    bx, by = coords[tri[:, 1], 0], coords[tri[:, 1], 1]
+    cx, cy = coords[tri[:, 2], 0], coords[tri[:, 2], 1]
+
+    bx, by = bx - ax, by - ay                 # repère centré sur a
+    cx, cy = cx - ax, cy - ay
+
+    D = 2.0 * (bx * cy - by * cx)
+    flat = np.abs(D) < EPS
+    D = np.where(flat, 1.0, D)
+
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+
+    ux = (cy * b2 - by * c2) / D
+    uy = (bx * c2 - cx * b2) / D
+    cr2 = ux * ux + uy * uy
+    ux += ax
+    uy += ay
+
+    ux[flat] = uy[flat] = cr2[flat] = np.inf
+    return np.stack((ux, uy), axis=1), cr2
 
 
 def _find_bad_triangles(
-    point: tuple,
-    triangulation: list[Triangle],
-) -> list[Triangle]:
-    """Retourne les triangles dont le cercle circonscrit contient le point."""
-    return [t for t in triangulation if t.in_circumcircle(point)]
+    px: float,
+    py: float,
+    coords: np.ndarray,
+    tri: np.ndarray,
+    cc: np.ndarray,
+    cr2: np.ndarray,
+    alive: np.ndarray,
+) -> np.ndarray:
+    """
+    Retourne les indices des triangles vivants dont le cercle circonscrit
+    contient le point (px, py) — un seul test vectorisé sur tout le tableau.
+    """
+    d2 = (cc[:, 0] - px) ** 2 + (cc[:, 1] - py) ** 2
+    mask = (d2 < cr2 - EPS) & alive
+
+    # Triangles plats : pas de cercle fini, décision par prédicats exacts
+    flat = np.flatnonzero(np.isinf(cr2) & alive)
+    for k in flat.tolist():
+        a, b, c = coords[tri[k]].tolist()
+        ori = orient2d(*a, *b, *c)
+        mask[k] = ori != 0 and incircle_adaptive(*a, *b, *c, px, py) * ori > 0
 
+    return np.flatnonzero(mask)
 
-def _find_boundary(bad_triangles: list[Triangle]) -> list[tuple]:
+
+def _find_boundary(bad_tri: np.ndarray) -> list[tuple]:
     """
     Retourne les arêtes frontières du trou polygonal formé par les
     mauvais triangles (arêtes n'appartenant qu'à un seul mauvais triangle).
+
+    Chaque arête est comptée sous sa forme canonique (min, max) d'indices :
+    O(B) insertions dans un Counter au lieu de O(B²) comparaisons.
     """
-    boundary = []
+    counts: Counter = Counter()
 
-    for tri in bad_triangles:
-        for edge in tri.edges():
-            is_shared = any(
-                edge_equal(edge, other_edge)
-                for other in bad_triangles
-                if other is not tri
-                for other_edge in other.edges()
-            )
-            if not is_shared:
-                boundary.append(edge)
+    for a, b, c in bad_tri.tolist():
+        for u, v in ((a, b), (b, c), (c, a)):
+            counts[(u, v) if u < v else (v, u)] += 1
 
-    return boundary
+    return [edge for edge, k in counts.items() if k == 1]
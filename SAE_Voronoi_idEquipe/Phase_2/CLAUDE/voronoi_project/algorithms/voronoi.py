@@ -7,11 +7,28 @@ Stratégie :
 """
 
 import math
+from collections import Counter
 
-from geometry.primitives import EPS, pts_equal, edge_equal
+import numpy as np
+
+from geometry.primitives import EPS
 from geometry.triangle import Triangle
 from algorithms.clipping import sutherland_hodgman
 
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # numba est optionnel : boucle Python par site
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*_args, **_kwargs):
+        return lambda fn: fn
+
+# Construction des cellules en parallèle (numba, un site par itération de
+# prange). Mettre à False pour revenir à la boucle Python séquentielle.
+PARALLEL = True
+
 
 def compute_voronoi(
     points: list[tuple],
@@ -33,15 +50,24 @@ def compute_voronoi(
     xmin, xmax, ymin, ymax = bbox
     far = math.sqrt((xmax - xmin) ** 2 + (ymax - ymin) ** 2) * 10.0
 
-    adj = _build_adjacency(points, triangles)
-    hull_edges = _find_hull_edges(triangles)
-    centroid = _centroid(points)
+    tri_ids = _vertex_indices(points, triangles)
+    hull_edges = _find_hull_edges(triangles, tri_ids)
+    far_xy, far_rows = _compute_far_vertices(
+        hull_edges, points, _centroid(points), far,
+    )
 
+    if _HAS_NUMBA and PARALLEL:
+        return _build_cells_parallel(
+            points, triangles, tri_ids, far_xy, far_rows, bbox,
+        )
+
+    adj = _build_adjacency(len(points), triangles, tri_ids)
     cells: dict[int, list[tuple]] = {}
 
     for i, site in enumerate(points):
+        far_verts = far_xy[far_rows[i]].tolist() if i in far_rows else []
         cell = _build_cell(
-            site, adj[i], hull_edges, centroid, far,
+            site, adj[i], far_verts,
             xmin, xmax, ymin, ymax,
         )
         if cell is not None:
@@ -52,40 +78,81 @@ def compute_voronoi(
 
 # ── Helpers privés ────────────────────────────────────────────────────────────
 
-def _build_adjacency(
+def _point_key(p: tuple) -> tuple:
+    """Clé de hachage d'un point : coordonnées arrondies à 1e-9."""
+    return (round(p[0], 9), round(p[1], 9))
+
+
+def _vertex_indices(
     points: list[tuple],
     triangles: list[Triangle],
+) -> list[tuple]:
+    """
+    Retourne, pour chaque triangle, les indices (ia, ib, ic) de ses sommets
+    dans `points` (-1 si le sommet n'est pas un site).
+
+    Les triangles issus de bowyer_watson portent déjà leurs indices ; pour
+    les autres (construits à la main), on les retrouve une fois par clé
+    arrondie.
+    """
+    if all(tri.indices is not None for tri in triangles):
+        return [tri.indices for tri in triangles]
+
+    pt_index = {_point_key(p): i for i, p in enumerate(points)}
+    return [
+        tri.indices if tri.indices is not None else tuple(
+            pt_index.get(_point_key(v), -1) for v in (tri.a, tri.b, tri.c)
+        )
+        for tri in triangles
+    ]
+
+
+def _build_adjacency(
+    n_points: int,
+    triangles: list[Triangle],
+    tri_ids: list[tuple],
 ) -> dict[int, list[Triangle]]:
-    """Construit le mapping index_point → liste des triangles adjacents."""
-    adj: dict[int, list[Triangle]] = {i: [] for i in range(len(points))}
+    """
+    Construit le mapping index_point → liste des triangles adjacents.
+
+    Les sommets sont identifiés par leurs indices entiers (`tri_ids`) :
+    aucune recherche ni comparaison de coordonnées.
+    """
+    adj: dict[int, list[Triangle]] = {i: [] for i in range(n_points)}
 
-    for tri in triangles:
-        for i, p in enumerate(points):
-            for v in (tri.a, tri.b, tri.c):
-                if pts_equal(v, p):
-                    adj[i].append(tri)
-                    break
+    for tri, ids in zip(triangles, tri_ids):
+        for i in ids:
+            if i >= 0:
+                adj[i].append(tri)
 
     return adj
 
 
-def _find_hull_edges(triangles: list[Triangle]) -> list[tuple]:
+def _find_hull_edges(
+    triangles: list[Triangle],
+    tri_ids: list[tuple],
+) -> list[tuple]:
     """
     Retourne les arêtes de l'enveloppe convexe : arêtes qui n'appartiennent
-    qu'à un seul triangle dans la triangulation.
-    """
-    all_edges = [(e, tri) for tri in triangles for e in tri.edges()]
+    qu'à un seul triangle dans la triangulation, sous la forme
+    ((ia, ib), triangle).
 
-    hull = []
-    for idx, (e1, t1) in enumerate(all_edges):
-        is_hull = not any(
-            j != idx and edge_equal(e1, e2)
-            for j, (e2, _) in enumerate(all_edges)
-        )
-        if is_hull:
-            hull.append((e1, t1))
-
-    return hull
+    Un seul passage : chaque arête est comptée sous sa clé canonique
+    (min, max) d'indices, au lieu de comparer toutes les paires.
+    """
+    edge_count: Counter = Counter()
+    edge_owner: dict[tuple, tuple] = {}
+
+    for tri, (ia, ib, ic) in zip(triangles, tri_ids):
+        for u, v in ((ia, ib), (ib, ic), (ic, ia)):
+            key = (u, v) if u < v else (v, u)
+            edge_count[key] += 1
+            edge_owner[key] = ((u, v), tri)
+
+    return [
+        edge_owner[key] for key, k in edge_count.items()
+        if k == 1 and key[0] >= 0
+    ]
 
 
 def _centroid(points: list[tuple]) -> tuple:
@@ -97,38 +164,10 @@ def _centroid(points: list[tuple]) -> tuple:
     )
 
 
-def _outward_normal(edge: tuple, centroid: tuple) -> tuple:
-    """
-    Calcule la normale unitaire à une arête, orientée vers l'extérieur
-    du nuage (opposée au centroïde).
-    """
-    ex = edge[1][0] - edge[0][0]
-    ey = edge[1][1] - edge[0][1]
-
-    n1 = (-ey,  ex)
-    n2 = ( ey, -ex)
-
-    mid_x = (edge[0][0] + edge[1][0]) / 2.0
-    mid_y = (edge[0][1] + edge[1][1]) / 2.0
-
-    cx, cy = centroid
-    d1 = (mid_x + n1[0] - cx) ** 2 + (mid_y + n1[1] - cy) ** 2
-    d2 = (mid_x + n2[0] - cx) ** 2 + (mid_y + n2[1] - cy) ** 2
-
-    nx, ny = n1 if d1 > d2 else n2
-    length = math.sqrt(nx * nx + ny * ny)
-
-    if length < EPS:
-        return (0.0, 0.0)
-    return (nx / length, ny / length)
-
-
 def _build_cell(
     site: tuple,
     adj_triangles: list[Triangle],
-    hull_edges: list[tuple],
-    centroid: tuple,
-    far: float,
+    far_verts: list,
     xmin: float,
     xmax: float,
     ymin: float,
@@ -151,12 +190,11 @@ def _build_cell(
     if not finite_verts:
         return None
 
-    # Rayons infinis pour les arêtes de bord adjacentes au site
-    far_verts = _compute_far_vertices(site, hull_edges, centroid, far)
-
-    # Trier tous les sommets par angle autour du site
-    all_verts = finite_verts + far_verts
-    all_verts.sort(key=lambda v: math.atan2(v[1] - py, v[0] - px))
+    # far_verts : extrémités lointaines des rayons infinis (site sur le hull)
+    # Trier tous les sommets par angle autour du site (atan2 vectorisé)
+    verts = np.array(finite_verts + far_verts, dtype=np.float64)
+    order = np.argsort(np.arctan2(verts[:, 1] - py, verts[:, 0] - px), kind="stable")
+    all_verts = list(map(tuple, verts[order].tolist()))
 
     # Clipper sur la bbox
     clipped = sutherland_hodgman(all_verts, xmin, xmax, ymin, ymax)
@@ -165,26 +203,210 @@ def _build_cell(
 
 
 def _compute_far_vertices(
-    site: tuple,
     hull_edges: list[tuple],
+    points: list[tuple],
     centroid: tuple,
     far: float,
-) -> list[tuple]:
+) -> tuple[np.ndarray, dict[int, list[int]]]:
     """
-    Pour un site sur l'enveloppe convexe, calcule les points lointains
-    le long des rayons de Voronoï non-bornés.
+    Calcule en un seul passage vectorisé, pour toutes les arêtes du hull,
+    le point lointain le long du rayon de Voronoï non-borné : circumcentre
+    + far × normale unitaire orientée vers l'extérieur (opposée au centroïde).
+
+    Returns:
+        (far_xy, far_rows) : tableau (H, 2) des points lointains et mapping
+        index_site → lignes de far_xy des arêtes du hull incidentes au site.
     """
-    far_verts = []
+    if not hull_edges:
+        return np.empty((0, 2)), {}
 
-    for edge, tri in hull_edges:
-        if not (pts_equal(edge[0], site) or pts_equal(edge[1], site)):
-            continue
+    arr = np.array(
+        [(*points[u], *points[v], *tri.circumcenter) for (u, v), tri in hull_edges],
+        dtype=np.float64,
+    )
+    ax, ay, bx, by, ccx, ccy = arr.T
+    ex, ey = bx - ax, by - ay
+    mid_x, mid_y = (ax + bx) / 2.0, (ay + by) / 2.0
 
-        cc = tri.circumcenter
-        if math.isinf(cc[0]) or math.isinf(cc[1]):
+    # Normale candidate (-ey, ex) ou son opposée : la plus loin du centroïde
+    cx, cy = centroid
+    d1 = (mid_x - ey - cx) ** 2 + (mid_y + ex - cy) ** 2
+    d2 = (mid_x + ey - cx) ** 2 + (mid_y - ex - cy) ** 2
+    sign = np.where(d1 > d2, 1.0, -1.0)
+    nx, ny = -ey * sign, ex * sign
+
+    length = np.hypot(nx, ny)
+    degenerate = length < EPS
+    length[degenerate] = 1.0
+    nx = np.where(degenerate, 0.0, nx / length)
+    ny = np.where(degenerate, 0.0, ny / length)
+
+    far_xy = np.stack((ccx + nx * far, ccy + ny * far), axis=1)
+
+    finite = np.isfinite(ccx) & np.isfinite(ccy)
+    far_rows: dict[int, list[int]] = {}
+    for row, (edge, _) in enumerate(hull_edges):
+        if not finite[row]:
             continue
+        for i in edge:
+            far_rows.setdefault(i, []).append(row)
+
+    return far_xy, far_rows
+
+
+# ── Construction parallèle (numba) ────────────────────────────────────────────
+
+def _build_cells_parallel(
+    points: list[tuple],
+    triangles: list[Triangle],
+    tri_ids: list[tuple],
+    far_xy: np.ndarray,
+    far_rows: dict[int, list[int]],
+    bbox: tuple,
+) -> dict[int, list[tuple]]:
+    """
+    Même résultat que la boucle de `compute_voronoi`, calculé par le noyau
+    `_build_cells_nb` : adjacences et points lointains sont aplatis en
+    tableaux CSR (ptr, data) pour que chaque site soit traité
+    indépendamment dans un `prange`.
+    """
+    n = len(points)
+    sites = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    cc = np.array(
+        [tri.circumcenter for tri in triangles], dtype=np.float64,
+    ).reshape(-1, 2)
+
+    ids = np.array(tri_ids, dtype=np.int64).reshape(-1, 3)
+    adj_ptr, adj_tri = _to_csr(
+        ids.ravel(), np.repeat(np.arange(len(ids)), 3), n,
+    )
+    far_ptr, far_idx = _to_csr(
+        np.array([i for i, rows in far_rows.items() for _ in rows], dtype=np.int64),
+        np.array([r for rows in far_rows.values() for r in rows], dtype=np.int64),
+        n,
+    )
 
-        nx, ny = _outward_normal(edge, centroid)
-        far_verts.append((cc[0] + nx * far, cc[1] + ny * far))
+    degree = np.diff(adj_ptr) + np.diff(far_ptr)
+    cap = 2 * int(degree.max(initial=0)) + 8
+    out, counts = _build_cells_nb(
+        sites, cc, adj_ptr, adj_tri, far_ptr, far_xy[far_idx],
+        np.array(bbox, dtype=np.float64), cap,
+    )
 
-    return far_verts
+    xmin, xmax, ymin, ymax = bbox
+    cells: dict[int, list[tuple]] = {}
+    for i, k in enumerate(counts.tolist()):
+        if k >= 3:
+            cells[i] = list(map(tuple, out[i, :k].tolist()))
+        elif k < 0:
+            # Polygone trop grand pour le tampon : chemin Python pour ce site
+            adj = [triangles[t] for t in adj_tri[adj_ptr[i]:adj_ptr[i + 1]]]
+            far_verts = far_xy[far_rows[i]].tolist() if i in far_rows else []
+            cell = _build_cell(points[i], adj, far_verts, xmin, xmax, ymin, ymax)
+            if cell is not None:
+                cells[i] = cell
+
+    return cells
+
+
+def _to_csr(
+    keys: np.ndarray,
+    values: np.ndarray,
+    n: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Regroupe `values` par clé (0..n-1, les clés négatives sont ignorées)
+    en CSR. Tri stable : l'ordre d'origine est conservé pour chaque clé.
+    """
+    keep = keys >= 0
+    keys, values = keys[keep], values[keep]
+    ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n), out=ptr[1:])
+    return ptr, values[np.argsort(keys, kind="stable")]
+
+
+@njit(parallel=True, cache=True)
+def _build_cells_nb(sites, cc, adj_ptr, adj_tri, far_ptr, far_xy, bbox, cap):
+    """
+    Construit toutes les cellules, un site par itération de `prange`.
+
+    Returns:
+        (out, counts) : out[i, :counts[i]] est la cellule du site i ;
+        counts[i] vaut 0 si la cellule est invalide, -1 si elle dépasse
+        `cap` sommets (à recalculer hors noyau).
+    """
+    n = sites.shape[0]
+    out = np.empty((n, cap, 2))
+    counts = np.zeros(n, np.int64)
+    for i in prange(n):
+        counts[i] = _build_cell_nb(
+            sites[i, 0], sites[i, 1], cc,
+            adj_tri[adj_ptr[i]:adj_ptr[i + 1]],
+            far_xy[far_ptr[i]:far_ptr[i + 1]],
+            bbox, out[i],
+        )
+    return out, counts
+
+
+@njit(cache=True)
+def _build_cell_nb(px, py, cc, adj, far_verts, bbox, out):
+    """Version tableau de `_build_cell` ; écrit la cellule dans `out`."""
+    k = 0
+    verts = np.empty((len(adj) + len(far_verts), 2))
+    for t in adj:
+        if not np.isinf(cc[t, 0]):
+            verts[k, 0], verts[k, 1] = cc[t, 0], cc[t, 1]
+            k += 1
+    if k == 0:
+        return 0
+    for r in range(len(far_verts)):
+        verts[k, 0], verts[k, 1] = far_verts[r, 0], far_verts[r, 1]
+        k += 1
+
+    angles = np.arctan2(verts[:k, 1] - py, verts[:k, 0] - px)
+    poly = verts[:k][np.argsort(angles, kind="mergesort")]
+
+    m = k
+    poly, m = _clip_axis_nb(poly, m, 0, bbox[0], True)
+    poly, m = _clip_axis_nb(poly, m, 0, bbox[1], False)
+    poly, m = _clip_axis_nb(poly, m, 1, bbox[2], True)
+    poly, m = _clip_axis_nb(poly, m, 1, bbox[3], False)
+
+    if m < 3:
+        return 0
+    if m > out.shape[0]:
+        return -1
+    out[:m] = poly[:m]
+    return m
+
+
+@njit(cache=True)
+def _clip_axis_nb(poly, m, axis, bound, keep_greater):
+    """
+    Une passe de Sutherland-Hodgman contre la droite coord[axis] = bound
+    (mêmes intersections que `_clip_x` / `_clip_y` de clipping.py).
+    """
+    out = np.empty((2 * m, 2))
+    k = 0
+    other = 1 - axis
+    for idx in range(m):
+        prev = poly[idx - 1 if idx > 0 else m - 1]
+        cur = poly[idx]
+        if keep_greater:
+            cur_in, prev_in = cur[axis] >= bound, prev[axis] >= bound
+        else:
+            cur_in, prev_in = cur[axis] <= bound, prev[axis] <= bound
+
+        if cur_in != prev_in:
+            d = cur[axis] - prev[axis]
+            out[k, axis] = bound
+            if abs(d) < EPS:
+                out[k, other] = prev[other]
+            else:
+                t = (bound - prev[axis]) / d
+                out[k, other] = prev[other] + t * (cur[other] - prev[other])
+            k += 1
+        if cur_in:
+            out[k, 0], out[k, 1] = cur[0], cur[1]
+            k += 1
+    return out, k
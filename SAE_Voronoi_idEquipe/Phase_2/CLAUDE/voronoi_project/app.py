@@ -22,9 +22,10 @@ _PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 if _PROJECT_ROOT not in sys.path:
     sys.path.insert(0, _PROJECT_ROOT)
 
+import numpy as np
 import streamlit as st
 
-from algorithms import bowyer_watson, compute_voronoi
+from algorithms import triangulate, compute_voronoi
 from loaders.parser import load_points
 from visualization.colors import generate_colors, Palette
 from visualization.renderer import draw_voronoi, RenderConfig
@@ -59,31 +60,62 @@ h1 { font-size: 2.2rem !important; }
 # ─────────────────────────────────────────────────────────────────────────────
 
 def _deduplicate(points: list) -> list:
-    """Supprime les doublons en conservant l'ordre d'apparition."""
-    seen, unique = set(), []
-    for p in points:
-        key = (round(p[0], 6), round(p[1], 6))
-        if key not in seen:
-            seen.add(key)
-            unique.append(p)
-    return unique
+    """
+    Supprime les doublons (à 1e-6 près) en conservant l'ordre d'apparition.
+
+    Les coordonnées arrondies à 6 décimales (en float64 : pas de
+    débordement pour les grandes valeurs) sont dédoublonnées par
+    `np.unique` (tri C) ; `return_index` donne la première occurrence.
+    """
+    arr = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    _, first_idx = np.unique(np.round(arr, 6), axis=0, return_index=True)
+    return list(map(tuple, arr[np.sort(first_idx)].tolist()))
 
 
 def _compute_bbox(points: list, margin_ratio: float = 0.08) -> tuple:
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    margin = max(max(xs) - min(xs), max(ys) - min(ys)) * margin_ratio + 1.0
-    return (min(xs) - margin, max(xs) + margin,
-            min(ys) - margin, max(ys) + margin)
+    arr = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    (mn_x, mn_y), (mx_x, mx_y) = arr.min(axis=0).tolist(), arr.max(axis=0).tolist()
+    margin = max(mx_x - mn_x, mx_y - mn_y) * margin_ratio + 1.0
+    return (mn_x - margin, mx_x + margin,
+            mn_y - margin, mx_y + margin)
+
 
+def _fig_to_bytes(fig, config: RenderConfig) -> io.BytesIO:
+    """
+    Sérialise la figure en PNG au DPI d'affichage.
 
-def _fig_to_bytes(fig, bg_color: str) -> bytes:
+    Pas de `bbox_inches="tight"` ni de changement de DPI : matplotlib
+    réutilise la mise en page déjà calculée au lieu de refaire un rendu.
+    """
     buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight", facecolor=bg_color)
+    fig.savefig(buf, format="png", dpi=config.dpi, facecolor=config.bg_color)
     buf.seek(0)
     return buf
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+#  Calculs mis en cache
+# ─────────────────────────────────────────────────────────────────────────────
+# Chaque interaction (palette, couleurs, options d'affichage) relance le
+# script : les résultats ne dépendant que des points sont mémorisés par
+# Streamlit, clé = tuple des points. Le rendu, qui dépend de la config,
+# n'est pas mis en cache.
+
+@st.cache_data(show_spinner=False)
+def _cached_delaunay(pts: tuple, fast: bool) -> list:
+    return triangulate(list(pts), fast=fast)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_bbox(pts: tuple) -> tuple:
+    return _compute_bbox(list(pts))
+
+
+@st.cache_data(show_spinner=False)
+def _cached_voronoi(pts: tuple, bbox: tuple, fast: bool) -> dict:
+    return compute_voronoi(list(pts), _cached_delaunay(pts, fast), bbox)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 #  Sections UI
 # ─────────────────────────────────────────────────────────────────────────────
@@ -114,6 +146,13 @@ def _render_sidebar():
         show_edges    = st.checkbox("Arêtes Voronoï",         value=True)
         show_delaunay = st.checkbox("Triangulation Delaunay", value=False)
 
+        st.subheader("⚡ Moteur")
+        fast = st.checkbox(
+            "Backend rapide (scipy/Qhull)", value=False,
+            help="scipy.spatial.Delaunay si scipy est installé ; "
+                 "Bowyer-Watson reste l'implémentation de référence."
+        )
+
         st.subheader("🎲 Points aléatoires")
         n_random  = st.slider("Nombre de points", 5, 300, 40)
         area_size = st.slider("Taille zone",      100, 1000, 500)
@@ -131,7 +170,8 @@ def _render_sidebar():
         bg_color=bg_color, edge_color=edge_color, site_color=site_color,
         fig_size=fig_size,
     )
-    return uploaded, gen_btn, n_random, area_size, rnd_seed, config, palette, color_seed
+    return (uploaded, gen_btn, n_random, area_size, rnd_seed,
+            config, palette, color_seed, fast)
 
 
 def _render_welcome() -> None:
@@ -215,19 +255,22 @@ def _load_or_generate(uploaded, gen_btn, n_random, area_size, rnd_seed):
     return None
 
 
-def _run_pipeline(points, config, palette, color_seed) -> None:
+def _run_pipeline(points, config, palette, color_seed, fast) -> None:
     """Exécute triangulation → Voronoï → rendu → affichage."""
-    with st.spinner("🔧 Triangulation de Delaunay (Bowyer-Watson)…"):
-        triangles = bowyer_watson(points)
+    pts = tuple(map(tuple, points))
+
+    engine = "Qhull" if fast else "Bowyer-Watson"
+    with st.spinner(f"🔧 Triangulation de Delaunay ({engine})…"):
+        triangles = _cached_delaunay(pts, fast)
 
-    bbox = _compute_bbox(points)
+    bbox = _cached_bbox(pts)
 
     with st.spinner("🎨 Construction du diagramme de Voronoï…"):
-        cells = compute_voronoi(points, triangles, bbox)
+        cells = _cached_voronoi(pts, bbox, fast)
 
     _render_stats(points, triangles, cells)
 
-    colors = generate_colors(len(points), palette=palette, seed=color_seed)
+    colors = generate_colors(len(points), palette=palette, seed=color_seed)  # LRU interne
 
     with st.spinner("🖌️ Rendu…"):
         fig = draw_voronoi(points, triangles, cells, colors, config)
@@ -236,7 +279,7 @@ def _run_pipeline(points, config, palette, color_seed) -> None:
 
     st.download_button(
         "⬇️ Télécharger le diagramme (PNG)",
-        data=_fig_to_bytes(fig, config.bg_color),
+        data=_fig_to_bytes(fig, config),
         file_name="voronoi_diagram.png",
         mime="image/png",
     )
@@ -259,13 +302,12 @@ def main() -> None:
     st.markdown("## 🔷 Diagramme de Voronoï")
     st.markdown(
         "Triangulation de Delaunay **(Bowyer-Watson)** implémentée manuellement "
-        "— sans `scipy.spatial`."
+        "— `scipy.spatial` (Qhull) en option."
     )
     st.divider()
 
-    uploaded, gen_btn, n_random, area_size, rnd_seed, config, palette, color_seed = (
-        _render_sidebar()
-    )
+    (uploaded, gen_btn, n_random, area_size, rnd_seed,
+     config, palette, color_seed, fast) = _render_sidebar()
 
     points = _load_or_generate(uploaded, gen_btn, n_random, area_size, rnd_seed)
 
@@ -279,7 +321,7 @@ def main() -> None:
         st.error("❌ Au moins 3 points distincts sont nécessaires.")
         return
 
-    _run_pipeline(points, config, palette, color_seed)
+    _run_pipeline(points, config, palette, color_seed, fast)
 
 
 if __name__ == "__main__":
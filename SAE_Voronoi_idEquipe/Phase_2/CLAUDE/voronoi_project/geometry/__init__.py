@@ -1,4 +1,9 @@
-from geometry.primitives import EPS, pts_equal, edge_equal
+from geometry.primitives import (
+    EPS, pts_equal, edge_equal, orient2d, incircle_adaptive,
+)
 from geometry.triangle import Triangle
 
-__all__ = ["EPS", "pts_equal", "edge_equal", "Triangle"]
+__all__ = [
+    "EPS", "pts_equal", "edge_equal", "orient2d", "incircle_adaptive",
+    "Triangle",
+]
@@ -2,6 +2,8 @@
 Primitives géométriques de base.
 """
 
+from fractions import Fraction
+
 EPS = 1e-9
 
 
@@ -16,3 +18,73 @@ def edge_equal(e1: tuple, e2: tuple) -> bool:
         (pts_equal(e1[0], e2[0]) and pts_equal(e1[1], e2[1])) or
         (pts_equal(e1[0], e2[1]) and pts_equal(e1[1], e2[0]))
     )
+
+
+# ── Prédicats adaptatifs (Shewchuk) ───────────────────────────────────────────
+# Évaluation flottante rapide ; si le résultat tombe sous la borne d'erreur
+# a priori, on recalcule exactement avec des fractions. Seuls les cas
+# quasi-dégénérés (≈ 1 %) paient le surcoût.
+
+_U = 2.0 ** -53                                 # epsilon machine (demi-ulp)
+_CCW_ERRBOUND = (3.0 + 16.0 * _U) * _U
+_ICC_ERRBOUND = (10.0 + 96.0 * _U) * _U
+
+
+def _sign(v) -> int:
+    return int(v > 0) - int(v < 0)
+
+
+def orient2d(ax: float, ay: float, bx: float, by: float,
+             cx: float, cy: float) -> int:
+    """
+    Signe de l'orientation du triangle abc : +1 (anti-horaire),
+    -1 (horaire), 0 (colinéaire). Exact pour toute entrée flottante.
+    """
+    detleft = (ax - cx) * (by - cy)
+    detright = (ay - cy) * (bx - cx)
+    det = detleft - detright
+    if abs(det) > _CCW_ERRBOUND * (abs(detleft) + abs(detright)):
+        return _sign(det)
+
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+    return _sign((ax - cx) * (by - cy) - (ay - cy) * (bx - cx))
+
+
+def incircle_adaptive(ax: float, ay: float, bx: float, by: float,
+                      cx: float, cy: float, px: float, py: float) -> int:
+    """
+    Signe du déterminant in-circle de p par rapport au cercle passant par
+    a, b, c : +1 si p est à l'intérieur (abc anti-horaire), -1 à
+    l'extérieur, 0 si cocirculaire. Le signe s'inverse si abc est horaire.
+    """
+    adx, ady = ax - px, ay - py
+    bdx, bdy = bx - px, by - py
+    cdx, cdy = cx - px, cy - py
+
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+
+    det = (alift * (bdxcdy - cdxbdy)
+           + blift * (cdxady - adxcdy)
+           + clift * (adxbdy - bdxady))
+    permanent = ((abs(bdxcdy) + abs(cdxbdy)) * alift
+                 + (abs(cdxady) + abs(adxcdy)) * blift
+                 + (abs(adxbdy) + abs(bdxady)) * clift)
+    if abs(det) > _ICC_ERRBOUND * permanent:
+        return _sign(det)
+
+    ax, ay, bx, by, cx, cy, px, py = map(
+        Fraction, (ax, ay, bx, by, cx, cy, px, py)
+    )
+    adx, ady = ax - px, ay - py
+    bdx, bdy = bx - px, by - py
+    cdx, cdy = cx - px, cy - py
+    return _sign(
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+        + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+        + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+    )
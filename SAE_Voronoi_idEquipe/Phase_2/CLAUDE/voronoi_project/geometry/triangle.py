@@ -3,25 +3,47 @@ Classe Triangle avec calcul paresseux du cercle circonscrit.
 """
 
 import math
-from geometry.primitives import EPS, pts_equal
+from geometry.primitives import EPS, orient2d, incircle_adaptive
 
 
 class Triangle:
     """
     Triangle défini par trois sommets (a, b, c).
 
+    `indices` (optionnel) : indices entiers des sommets dans le nuage de
+    points d'origine. Renseignés par bowyer_watson, ils servent d'identité
+    exacte des sommets (comparaison d'entiers au lieu de flottants à EPS près).
+
     Le cercle circonscrit est calculé à la demande (lazy) et mis en cache.
     Pour un triangle dégénéré (points colinéaires), le circumcenter est (∞, ∞).
+    Le test in-circle n'utilise pas ce cercle : il repose sur le prédicat
+    adaptatif (exact), valable aussi pour les triangles très plats.
     """
 
-    __slots__ = ("a", "b", "c", "_cc", "_cr2")
-
-    def __init__(self, a: tuple, b: tuple, c: tuple) -> None:
+    __slots__ = ("a", "b", "c", "indices", "_cc", "_cr2", "_edges", "_ori")
+
+    def __init__(
+        self,
+        a: tuple,
+        b: tuple,
+        c: tuple,
+        circumcenter: tuple | None = None,
+        circumradius2: float | None = None,
+        indices: tuple | None = None,
+    ) -> None:
+        """
+        `circumcenter` / `circumradius2` permettent de fournir un cercle
+        déjà calculé (ex. par lot dans bowyer_watson) ; sinon il sera
+        calculé à la demande.
+        """
         self.a = a
         self.b = b
         self.c = c
-        self._cc: tuple | None = None   # centre du cercle circonscrit
-        self._cr2: float | None = None  # rayon² du cercle circonscrit
+        self.indices: tuple | None = indices      # (ia, ib, ic) ou None
+        self._cc: tuple | None = circumcenter     # centre du cercle circonscrit
+        self._cr2: float | None = circumradius2  # rayon² du cercle circonscrit
+        self._edges: tuple | None = None          # arêtes, construites au 1er appel
+        self._ori: int | None = None              # signe de l'orientation abc
 
     # ── Calcul interne ────────────────────────────────────────────
 
@@ -30,22 +52,26 @@ class Triangle:
         bx, by = self.b
         cx, cy = self.c
 
-        D = 2.0 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+        # Repère centré sur a : moins de produits, et pas d'annulation
+        # catastrophique entre les grands termes x² + y² loin de l'origine.
+        bx, by = bx - ax, by - ay
+        cx, cy = cx - ax, cy - ay
+
+        D = 2.0 * (bx * cy - by * cx)
 
         if abs(D) < EPS:
             self._cc = (math.inf, math.inf)
             self._cr2 = math.inf
             return
 
-        a2 = ax * ax + ay * ay
         b2 = bx * bx + by * by
         c2 = cx * cx + cy * cy
 
-        ux = (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / D
-        uy = (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / D
+        ux = (cy * b2 - by * c2) / D
+        uy = (bx * c2 - cx * b2) / D
 
-        self._cc = (ux, uy)
-        self._cr2 = (ax - ux) ** 2 + (ay - uy) ** 2
+        self._cc = (ux + ax, uy + ay)
+        self._cr2 = ux * ux + uy * uy
 
     # ── Propriétés publiques ──────────────────────────────────────
 
@@ -64,25 +90,43 @@ class Triangle:
     # ── Méthodes publiques ────────────────────────────────────────
 
     def in_circumcircle(self, p: tuple) -> bool:
-        """Retourne True si p est strictement à l'intérieur du cercle circonscrit."""
-        if self._cr2 is None:
-            self._compute_circumcircle()
-        if self._cr2 == math.inf:
+        """
+        Retourne True si p est strictement à l'intérieur du cercle circonscrit.
+
+        Prédicat adaptatif de Shewchuk : déterminant 3×3 flottant sur les
+        coordonnées relatives à p, recalculé exactement seulement s'il tombe
+        sous sa borne d'erreur. Faux pour un triangle colinéaire.
+        """
+        if self._ori is None:
+            self._ori = orient2d(*self.a, *self.b, *self.c)
+        if self._ori == 0:
             return False
-        ccx, ccy = self._cc
-        dx, dy = p[0] - ccx, p[1] - ccy
-        return dx * dx + dy * dy < self._cr2 - EPS
+        return incircle_adaptive(*self.a, *self.b, *self.c, *p) * self._ori > 0
+
+    def edges(self) -> tuple:
+        """
+        Retourne les 3 arêtes orientées du triangle.
 
-    def edges(self) -> list[tuple]:
-        """Retourne les 3 arêtes orientées du triangle."""
-        return [(self.a, self.b), (self.b, self.c), (self.c, self.a)]
+        Le tuple est construit au premier appel puis mis en cache : les
+        appels suivants ne font aucune allocation.
+        """
+        if self._edges is None:
+            self._edges = ((self.a, self.b), (self.b, self.c), (self.c, self.a))
+        return self._edges
+
+    def index_edges(self) -> list[tuple]:
+        """Retourne les 3 arêtes orientées sous forme de paires d'indices."""
+        ia, ib, ic = self.indices
+        return [(ia, ib), (ib, ic), (ic, ia)]
 
     def has_supervertex(self, super_verts: tuple) -> bool:
-        """Retourne True si au moins un sommet appartient au super-triangle."""
-        return any(
-            pts_equal(self.a, s) or pts_equal(self.b, s) or pts_equal(self.c, s)
-            for s in super_verts
-        )
+        """
+        Retourne True si au moins un sommet appartient au super-triangle.
+
+        Les sommets du super-triangle sont recopiés tels quels, jamais
+        recalculés : l'égalité exacte des tuples suffit.
+        """
+        return self.a in super_verts or self.b in super_verts or self.c in super_verts
 
     def __repr__(self) -> str:
         return f"Triangle({self.a}, {self.b}, {self.c})"
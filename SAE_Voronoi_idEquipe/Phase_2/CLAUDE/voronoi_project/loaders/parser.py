@@ -17,6 +17,10 @@ Formats TXT supportés (une paire par ligne) :
 import json
 from typing import IO
 
+# Séparateurs TXT : virgules, points-virgules et parenthèses deviennent des
+# espaces en une passe C (`str.translate`), puis `split()` sans argument.
+_SEP_TO_SPACE = str.maketrans(",;()", "    ")
+
 
 def parse_json(content: str) -> list[tuple]:
     """
@@ -28,22 +32,10 @@ def parse_json(content: str) -> list[tuple]:
     """
     data = json.loads(content)
 
-    if isinstance(data, list):
-        if not data:
-            return []
-        if isinstance(data[0], (list, tuple)):
-            return [(float(p[0]), float(p[1])) for p in data]
-        if isinstance(data[0], dict):
-            return [(float(p["x"]), float(p["y"])) for p in data]
-
     if isinstance(data, dict):
-        pts = data.get("points", data.get("Points", []))
-        return parse_json(json.dumps(pts))
+        data = data.get("points", data.get("Points", []))
 
-    raise ValueError(
-        "Format JSON non reconnu. "
-        "Attendu : [[x,y],...], {\"points\":[[x,y],...]}, ou [{\"x\":...,\"y\":...},...]"
-    )
+    return _from_list(data)
 
 
 def parse_txt(content: str) -> list[tuple]:
@@ -55,18 +47,15 @@ def parse_txt(content: str) -> list[tuple]:
     """
     points = []
 
-    for line in content.splitlines():
-        line = line.strip()
+    # Une seule traduction sur tout le contenu, puis découpage par ligne
+    for line in content.translate(_SEP_TO_SPACE).splitlines():
+        parts = line.split()
 
-        if not line or line.startswith("#"):
+        if not parts or parts[0].startswith("#"):
             continue
 
-        line = line.strip("()")
-        sep = _detect_separator(line)
-        parts = line.split(sep) if sep else line.split()
-
         if len(parts) >= 2:
-            points.append((float(parts[0].strip()), float(parts[1].strip())))
+            points.append((float(parts[0]), float(parts[1])))
 
     return points
 
@@ -101,10 +90,23 @@ def load_points(uploaded_file: IO) -> list[tuple]:
 
 # ── Helpers privés ────────────────────────────────────────────────────────────
 
-def _detect_separator(line: str) -> str | None:
-    """Détecte le séparateur utilisé dans une ligne."""
-    if "," in line:
-        return ","
-    if ";" in line:
-        return ";"
-    return None  # espace par défaut
+def _from_list(data) -> list[tuple]:
+    """
+    Convertit une structure JSON déjà décodée ([[x, y], ...] ou
+    [{"x": .., "y": ..}, ...]) en liste de points.
+
+    Raises:
+        ValueError: si le format n'est pas reconnu.
+    """
+    if isinstance(data, list):
+        if not data:
+            return []
+        if isinstance(data[0], (list, tuple)):
+            return [(float(p[0]), float(p[1])) for p in data]
+        if isinstance(data[0], dict):
+            return [(float(p["x"]), float(p["y"])) for p in data]
+
+    raise ValueError(
+        "Format JSON non reconnu. "
+        "Attendu : [[x,y],...], {\"points\":[[x,y],...]}, ou [{\"x\":...,\"y\":...},...]"
+    )
@@ -2,9 +2,10 @@
 Tests unitaires — Diagramme de Voronoï (architecture modulaire)
 ===============================================================
 Couvre :
-  - geometry.primitives  : pts_equal, edge_equal
+  - geometry.primitives  : pts_equal, edge_equal, orient2d, incircle_adaptive
   - geometry.triangle    : Triangle (circumcircle, in_circumcircle, edges, has_supervertex)
-  - algorithms.delaunay  : bowyer_watson (cas limites, propriété Delaunay, formule d'Euler)
+  - algorithms.delaunay  : bowyer_watson (cas limites, propriété Delaunay, formule d'Euler),
+                          triangulate (backend Qhull)
   - algorithms.clipping  : sutherland_hodgman
   - algorithms.voronoi   : compute_voronoi (couverture, géométrie)
   - loaders.parser            : parse_json, parse_txt
@@ -21,7 +22,17 @@ import math
 import json
 import random
 import unittest
-from unittest.mock import MagicMock
+from functools import lru_cache
+from unittest import mock
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba est optionnel : le noyau de test reste du Python pur
+    def njit(*_args, **_kwargs):
+        return lambda fn: fn
+    prange = range
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  Résolution du chemin — fonctionne depuis tests/ ou depuis la racine
@@ -34,19 +45,11 @@ _root   = os.path.dirname(_here)   # dossier parent = racine du projet
 if _root not in sys.path:
     sys.path.insert(0, _root)
 
-# Neutraliser Streamlit et Matplotlib avant tout import des modules métier
-for _mod in [
-    "streamlit",
-    "matplotlib", "matplotlib.pyplot", "matplotlib.patches",
-    "matplotlib.collections", "matplotlib.colors", "matplotlib.figure",
-]:
-    sys.modules.setdefault(_mod, MagicMock())
-
 # ── Imports des modules à tester ─────────────────────────────────────────────
 
-from geometry.primitives import EPS, pts_equal, edge_equal
+from geometry.primitives import EPS, pts_equal, edge_equal, orient2d, incircle_adaptive
 from geometry.triangle   import Triangle
-from algorithms.delaunay import bowyer_watson
+from algorithms.delaunay import bowyer_watson, triangulate
 from algorithms.clipping import sutherland_hodgman
 from algorithms.voronoi  import compute_voronoi
 from loaders.parser           import parse_json, parse_txt
@@ -61,21 +64,116 @@ def nearly(a: float, b: float, tol: float = 1e-6) -> bool:
     return abs(a - b) < tol
 
 
-def point_in_polygon(px: float, py: float, polygon: list) -> bool:
-    """Ray-casting : True si (px, py) est à l'intérieur du polygone."""
-    n, inside, j = len(polygon), False, len(polygon) - 1
-    for i in range(n):
-        xi, yi = polygon[i]
-        xj, yj = polygon[j]
-        if ((yi > py) != (yj > py)) and (px < (xj - xi) * (py - yi) / (yj - yi) + xi):
-            inside = not inside
-        j = i
-    return inside
+def convex_hull_area(pts) -> float:
+    """Aire de l'enveloppe convexe (chaîne monotone d'Andrew, puis lacet)."""
+    pts = sorted(set(map(tuple, pts)))
+    cross = lambda o, a, b: (a[0]-o[0]) * (b[1]-o[1]) - (a[1]-o[1]) * (b[0]-o[0])
+    lower, upper = [], []
+    for chain, seq in ((lower, pts), (upper, pts[::-1])):
+        for p in seq:
+            while len(chain) >= 2 and cross(chain[-2], chain[-1], p) <= 0:
+                chain.pop()
+            chain.append(p)
+    hull = lower[:-1] + upper[:-1]
+    return abs(sum(cross((0.0, 0.0), hull[k - 1], hull[k])
+                   for k in range(len(hull)))) / 2.0
+
+
+def triangle_area(tri: Triangle) -> float:
+    (ax, ay), (bx, by), (cx, cy) = tri.a, tri.b, tri.c
+    return abs((bx - ax) * (cy - ay) - (by - ay) * (cx - ax)) / 2.0
+
+
+def points_in_polygon(pts, polygon) -> np.ndarray:
+    """
+    Ray-casting vectorisé : pour chaque point de `pts` (K, 2), True s'il est
+    à l'intérieur du polygone. Toutes les arêtes × tous les points en une
+    seule expression NumPy (diffusion (K, 1) contre (1, E)).
+    """
+    pts = np.asarray(pts, dtype=np.float64).reshape(-1, 2)
+    poly = np.asarray(polygon, dtype=np.float64)
+    xi, yi = poly[:, 0], poly[:, 1]
+    xj, yj = np.roll(xi, 1), np.roll(yi, 1)
+    px, py = pts[:, :1], pts[:, 1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cross = ((yi > py) != (yj > py)) & (px < (xj - xi) * (py - yi) / (yj - yi) + xi)
+    return np.logical_xor.reduce(cross, axis=1)
+
+
+@njit(cache=True, parallel=True)
+def count_incircle_violations(coords, tri, rel_tol):
+    """
+    Nombre de couples (triangle, point) où le point, distinct des sommets,
+    est strictement dans le cercle circonscrit du triangle.
+
+    Déterminant in-circle 3×3 sur les coordonnées translatées au point p
+    (|adx ady adx²+ady²| ...), signé par l'orientation du triangle ; un
+    point quasi cocirculaire (|det| ≤ rel_tol × permanent) n'est pas compté.
+
+    Les triangles sont indépendants : boucle `prange`, un compteur par
+    triangle, sommés à la fin.
+    """
+    counts = np.zeros(tri.shape[0], dtype=np.int64)
+    for t in prange(tri.shape[0]):
+        a, b, c = tri[t, 0], tri[t, 1], tri[t, 2]
+        ax, ay = coords[a, 0], coords[a, 1]
+        bx, by = coords[b, 0], coords[b, 1]
+        cx, cy = coords[c, 0], coords[c, 1]
+        ori = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+        sgn = 1.0 if ori > 0.0 else -1.0
+        for p in range(coords.shape[0]):
+            if p == a or p == b or p == c:
+                continue
+            px, py = coords[p, 0], coords[p, 1]
+            adx, ady = ax - px, ay - py
+            bdx, bdy = bx - px, by - py
+            cdx, cdy = cx - px, cy - py
+            alift = adx * adx + ady * ady
+            blift = bdx * bdx + bdy * bdy
+            clift = cdx * cdx + cdy * cdy
+            bc = bdx * cdy - cdx * bdy
+            ca = cdx * ady - adx * cdy
+            ab = adx * bdy - bdx * ady
+            det = alift * bc + blift * ca + clift * ab
+            perm = alift * abs(bc) + blift * abs(ca) + clift * abs(ab)
+            if det * sgn > rel_tol * perm:
+                counts[t] += 1
+    return counts.sum()
+
+
+def site_key(p, ndigits: int = 9) -> tuple:
+    """Clé de hachage d'un point : coordonnées arrondies."""
+    return (round(p[0], ndigits), round(p[1], ndigits))
+
+
+def site_index(points: list, ndigits: int = 9) -> dict:
+    """{clé arrondie → indice} : retrouve un sommet en O(1) au lieu de O(n)."""
+    return {site_key(p, ndigits): i for i, p in enumerate(points)}
+
+
+def site_grid(points: list) -> tuple[dict, float]:
+    """
+    Grille uniforme sur les sites : ({(gx, gy) → [indices]}, pas de grille).
+    Le pas vaut environ le diamètre moyen d'une cellule (aire de la bbox / n).
+    """
+    arr = np.asarray(points, dtype=np.float64)
+    span = np.ptp(arr, axis=0)
+    cell = math.sqrt(max(float(span[0] * span[1]), 1e-12) / len(arr)) or 1.0
+    grid: dict = {}
+    for i, key in enumerate(map(tuple, (arr // cell).astype(int).tolist())):
+        grid.setdefault(key, []).append(i)
+    return grid, cell
 
 
 def random_points(n: int, seed: int = 0, lo: float = 0.0, hi: float = 500.0) -> list:
-    rng = random.Random(seed)
-    return [(rng.uniform(lo, hi), rng.uniform(lo, hi)) for _ in range(n)]
+    """n points uniformes dans [lo, hi]², reproductibles par `seed`."""
+    return list(_random_points(n, seed, lo, hi))
+
+
+@lru_cache(maxsize=64)
+def _random_points(n: int, seed: int, lo: float, hi: float) -> tuple:
+    arr = np.random.default_rng(seed).uniform(lo, hi, size=(n, 2))
+    return tuple(map(tuple, arr.tolist()))
 
 
 def make_bbox(points: list, margin: float = 30.0) -> tuple:
@@ -86,6 +184,17 @@ def make_bbox(points: list, margin: float = 30.0) -> tuple:
 
 
 def run_voronoi(points: list, margin: float = 30.0):
+    """
+    Pipeline complet Delaunay + Voronoï. Mémorisé par (points, marge) :
+    plusieurs tests partagent les mêmes nuages ; les résultats ne sont
+    jamais modifiés par les tests.
+    """
+    return _cached_run_voronoi(tuple(map(tuple, points)), margin)
+
+
+@lru_cache(maxsize=32)
+def _cached_run_voronoi(pts: tuple, margin: float):
+    points    = list(pts)
     triangles = bowyer_watson(points)
     bbox      = make_bbox(points, margin)
     cells     = compute_voronoi(points, triangles, bbox)
@@ -132,6 +241,40 @@ class TestEdgeEqual(unittest.TestCase):
     def test_arete_degeneree(self):
         self.assertFalse(edge_equal((self.A, self.A), (self.A, self.B)))
 
+    def test_extremites_a_eps_pres(self):
+        self.assertTrue(edge_equal((self.A, self.B), ((1.0 + 1e-12, 0.0), self.A)))
+
+    def test_liste_et_tuple(self):
+        self.assertTrue(edge_equal([self.A, self.B], (self.B, self.A)))
+
+
+class TestPredicatsAdaptatifs(unittest.TestCase):
+
+    def test_orient2d_signes(self):
+        self.assertEqual(orient2d(0, 0, 1, 0, 0, 1),  1)
+        self.assertEqual(orient2d(0, 0, 0, 1, 1, 0), -1)
+        self.assertEqual(orient2d(0, 0, 1, 1, 2, 2),  0)
+
+    def test_orient2d_quasi_colineaire_exact(self):
+        # 0.1 + 0.2 != 0.3 en flottant : le résultat ne doit pas être 0
+        self.assertNotEqual(orient2d(0.0, 0.0, 0.1, 0.2, 0.3, 0.6000000000000001), 0)
+
+    def test_incircle_interieur_exterieur_cocirculaire(self):
+        a, b, c = (1.0, 0.0), (0.0, 1.0), (-1.0, 0.0)   # anti-horaire
+        self.assertEqual(incircle_adaptive(*a, *b, *c, 0.0, 0.0),   1)
+        self.assertEqual(incircle_adaptive(*a, *b, *c, 5.0, 5.0),  -1)
+        self.assertEqual(incircle_adaptive(*a, *b, *c, 0.0, -1.0),  0)
+
+    def test_incircle_signe_inverse_si_horaire(self):
+        a, b, c = (-1.0, 0.0), (0.0, 1.0), (1.0, 0.0)   # horaire
+        self.assertEqual(incircle_adaptive(*a, *b, *c, 0.0, 0.0), -1)
+
+    def test_scalaires_numpy(self):
+        self.assertEqual(orient2d(*np.array([0., 0., 1., 0., 0., 1.])), 1)
+        self.assertEqual(
+            incircle_adaptive(*np.array([1., 0., 0., 1., -1., 0., 0., 0.])), 1,
+        )
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 #  2. geometry.triangle
@@ -174,6 +317,12 @@ class TestTriangleCircumcircle(unittest.TestCase):
         _ = t.circumcenter
         self.assertIs(t._cc, ref)  # pas recalculé
 
+    def test_slots_sans_dict_par_instance(self):
+        t = Triangle((0.0, 0.0), (1.0, 0.0), (0.0, 1.0))
+        self.assertFalse(hasattr(t, "__dict__"))
+        with self.assertRaises(AttributeError):
+            t.attribut_inconnu = 1
+
 
 class TestTriangleInCircumcircle(unittest.TestCase):
 
@@ -191,10 +340,25 @@ class TestTriangleInCircumcircle(unittest.TestCase):
         # (0, -1) est sur le cercle → pas strictement intérieur
         self.assertFalse(self.t.in_circumcircle((0.0, -1.0)))
 
+    def test_point_juste_a_l_interieur(self):
+        # À 1e-12 du cercle : plus fin que EPS, tranché par le prédicat exact
+        self.assertTrue(self.t.in_circumcircle((0.0, -1.0 + 1e-12)))
+        self.assertFalse(self.t.in_circumcircle((0.0, -1.0 - 1e-12)))
+
+    def test_point_tableau_numpy(self):
+        self.assertTrue(self.t.in_circumcircle(np.array([0.0, -1.0 + 1e-12])))
+
     def test_triangle_degenere_rejette_tout(self):
         t = Triangle((0.0, 0.0), (1.0, 0.0), (2.0, 0.0))
         self.assertFalse(t.in_circumcircle((1.0, 0.5)))
 
+    def test_triangle_tres_plat_non_ignore(self):
+        # |D| < EPS : centre rejeté à l'infini, mais le cercle existe (centre
+        # très loin sous l'axe) → décision par le prédicat exact.
+        t = Triangle((0.0, 0.0), (1.0, 0.0), (0.5, 1e-10))
+        self.assertTrue(t.in_circumcircle((0.5, -1.0)))
+        self.assertFalse(t.in_circumcircle((0.5, 1.0)))
+
 
 class TestTriangleEdgesAndSupervertex(unittest.TestCase):
 
@@ -207,6 +371,10 @@ class TestTriangleEdgesAndSupervertex(unittest.TestCase):
         for s in [A, B, C]:
             self.assertIn(s, flat)
 
+    def test_edges_mis_en_cache(self):
+        t = Triangle((0,0),(1,0),(0,1))
+        self.assertIs(t.edges(), t.edges())
+
     def test_has_supervertex_detecte_sommet_present(self):
         S1, S2, S3 = (-100, -100), (0, 100), (100, -100)
         self.assertTrue(Triangle(S1, (1,1), (2,1)).has_supervertex((S1, S2, S3)))
@@ -238,6 +406,24 @@ class TestBowyerWatsonCasLimites(unittest.TestCase):
     def test_points_colineaires_ne_leve_pas_exception(self):
         self.assertIsInstance(bowyer_watson([(i, 0) for i in range(4)]), list)
 
+    def test_points_doublons_sans_recouvrement(self):
+        # Doublons exacts : pas de triangles superposés, chaque triangle
+        # porte la première occurrence de ses sommets
+        base = random_points(100, seed=0)
+        pts = base + base[:20]
+        tris = bowyer_watson(pts)
+        self.assertLessEqual(sum(map(triangle_area, tris)),
+                             convex_hull_area(pts) * (1 + 1e-9))
+        self.assertTrue(all(i < len(base) for t in tris for i in t.indices))
+
+    def test_petite_echelle_ne_leve_pas_exception(self):
+        # Triangles plats au sens de EPS : tranchés par les prédicats exacts
+        # sur des scalaires float64
+        pts = random_points(100, seed=3, hi=1e-3)
+        tris = bowyer_watson(pts)
+        self.assertGreaterEqual(len(tris), len(pts) - 2)
+        self.assertLessEqual(len(tris), 2 * len(pts))
+
 
 class TestBowyerWatsonProprietes(unittest.TestCase):
 
@@ -251,13 +437,9 @@ class TestBowyerWatsonProprietes(unittest.TestCase):
     ]
 
     def _count_delaunay_violations(self, points, triangles):
-        return sum(
-            1
-            for tri in triangles
-            for p in points
-            if not any(pts_equal(v, p) for v in (tri.a, tri.b, tri.c))
-            and tri.in_circumcircle(p)
-        )
+        coords = np.asarray(points, dtype=np.float64)
+        tri = np.array([t.indices for t in triangles], dtype=np.int64).reshape(-1, 3)
+        return count_incircle_violations(coords, tri, EPS)
 
     def test_propriete_delaunay(self):
         for name, pts, _ in self._CONFIGS:
@@ -282,21 +464,20 @@ class TestBowyerWatsonProprietes(unittest.TestCase):
     def test_aucun_sommet_super_triangle(self):
         pts = random_points(50, seed=42)
         tris = bowyer_watson(pts)
-        pt_set = {(round(p[0], 4), round(p[1], 4)) for p in pts}
+        idx = site_index(pts)
         for tri in tris:
             for v in (tri.a, tri.b, tri.c):
-                self.assertIn((round(v[0], 4), round(v[1], 4)), pt_set,
-                    f"Sommet hors-liste : {v}")
+                self.assertIn(site_key(v), idx, f"Sommet hors-liste : {v}")
 
     def test_tous_points_dans_au_moins_un_triangle(self):
         pts = random_points(20, seed=9)
         tris = bowyer_watson(pts)
+        pt_to_i = site_index(pts, ndigits=12)
         used = {
-            i
+            pt_to_i[key]
             for tri in tris
             for v in (tri.a, tri.b, tri.c)
-            for i, p in enumerate(pts)
-            if pts_equal(v, p)
+            if (key := site_key(v, ndigits=12)) in pt_to_i
         }
         for i in range(len(pts)):
             self.assertIn(i, used, f"Point #{i} absent de la triangulation")
@@ -305,6 +486,54 @@ class TestBowyerWatsonProprietes(unittest.TestCase):
         pts = random_points(25, seed=77)
         self.assertEqual(len(bowyer_watson(pts[:])), len(bowyer_watson(pts[:])))
 
+    def test_backend_rapide_meme_triangulation(self):
+        pts = random_points(40, seed=12)
+        key = lambda tris: {tuple(sorted(t.indices)) for t in tris}
+        # Le super-triangle étant fini, Bowyer-Watson peut perdre un triangle
+        # plat sur l'enveloppe (cercle circonscrit atteignant un super-sommet) :
+        # on vérifie l'inclusion, Qhull pouvant en compter un de plus.
+        self.assertLessEqual(key(bowyer_watson(pts)), key(triangulate(pts, fast=True)))
+
+    def test_backend_automatique_selon_la_taille(self):
+        from algorithms.delaunay import FAST_THRESHOLD
+        key = lambda tris: [t.indices for t in tris]
+        small = random_points(FAST_THRESHOLD - 1, seed=13)
+        self.assertEqual(key(triangulate(small, fast=None)), key(bowyer_watson(small)))
+        large = random_points(FAST_THRESHOLD, seed=13)
+        self.assertEqual(key(triangulate(large, fast=None)), key(triangulate(large, fast=True)))
+
+    def test_sous_module_accessible(self):
+        # Le paquet ne masque pas le sous-module par une fonction du même nom
+        import types
+        import algorithms.delaunay as module
+        self.assertIsInstance(module, types.ModuleType)
+
+    def test_indices_des_sommets(self):
+        pts = random_points(30, seed=9)
+        for tri in bowyer_watson(pts):
+            self.assertEqual(
+                (tri.a, tri.b, tri.c), tuple(pts[i] for i in tri.indices)
+            )
+
+    def test_cercles_circonscrits_precalcules(self):
+        for tri in bowyer_watson(random_points(30, seed=4)):
+            self.assertIsNotNone(tri._cc)
+            lazy = Triangle(tri.a, tri.b, tri.c)
+            self.assertTrue(nearly(tri.circumcenter[0], lazy.circumcenter[0]))
+            self.assertTrue(nearly(tri.circumcenter[1], lazy.circumcenter[1]))
+
+    def test_noyau_et_lot_meme_cercle_circonscrit(self):
+        from algorithms.delaunay import _circumcircle_nb, _circumcircles
+        # Loin de l'origine : les deux chemins travaillent dans le repère de a
+        coords = np.array(random_points(30, seed=4, lo=1e6, hi=1e6 + 10.0))
+        tri = np.array([(i, i + 1, i + 2) for i in range(28)], dtype=np.int64)
+        cc, cr2 = np.empty((28, 2)), np.empty(28)
+        for k in range(28):
+            _circumcircle_nb(coords, tri, k, cc, cr2)
+        ref_cc, ref_cr2 = _circumcircles(coords, tri)
+        np.testing.assert_array_equal(cc, ref_cc)
+        np.testing.assert_array_equal(cr2, ref_cr2)
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 #  4. algorithms.clipping (Sutherland-Hodgman)
@@ -391,46 +620,83 @@ class TestComputeVoronoiCouverture(unittest.TestCase):
 class TestComputeVoronoiGeometrie(unittest.TestCase):
     """Propriétés géométriques des cellules."""
 
+    _diagrams: dict = {}
+
+    @classmethod
+    def _diagram(cls, n: int, seed: int) -> tuple:
+        """(pts, bbox, cellules en tableaux (k, 2)), calculé une fois par jeu."""
+        if (n, seed) not in cls._diagrams:
+            pts = random_points(n, seed=seed)
+            _, bbox, cells = run_voronoi(pts)
+            cls._diagrams[n, seed] = (pts, bbox, {
+                i: np.asarray(poly, dtype=np.float64) for i, poly in cells.items()
+            })
+        return cls._diagrams[n, seed]
+
     def test_chaque_site_dans_sa_cellule(self):
-        pts = random_points(20, seed=5)
-        _, _, cells = run_voronoi(pts)
+        pts, _, cells = self._diagram(20, seed=5)
         for i, poly in cells.items():
-            px, py = pts[i]
             self.assertTrue(
-                point_in_polygon(px, py, poly),
+                points_in_polygon([pts[i]], poly)[0],
                 f"Site #{i} {pts[i]} n'est pas dans sa cellule"
             )
 
     def test_cellules_dans_la_bbox(self):
-        pts = random_points(30, seed=6)
-        _, bbox, cells = run_voronoi(pts)
+        _, bbox, cells = self._diagram(30, seed=6)
         xmin, xmax, ymin, ymax = bbox
         tol = 1e-6
         for i, poly in cells.items():
-            for x, y in poly:
-                self.assertGreaterEqual(x, xmin - tol, f"cellule {i}: x={x:.4f} < xmin")
-                self.assertLessEqual(x,   xmax + tol, f"cellule {i}: x={x:.4f} > xmax")
-                self.assertGreaterEqual(y, ymin - tol, f"cellule {i}: y={y:.4f} < ymin")
-                self.assertLessEqual(y,   ymax + tol, f"cellule {i}: y={y:.4f} > ymax")
+            x, y = poly[:, 0], poly[:, 1]
+            ok = (x >= xmin - tol) & (x <= xmax + tol) & (y >= ymin - tol) & (y <= ymax + tol)
+            self.assertTrue(ok.all(), f"cellule {i}: sommets hors bbox {poly[~ok].tolist()}")
 
     def test_cellules_ont_au_moins_3_sommets(self):
-        _, _, cells = run_voronoi(random_points(25, seed=8))
+        _, _, cells = self._diagram(25, seed=8)
         for i, poly in cells.items():
             self.assertGreaterEqual(len(poly), 3, f"Cellule #{i} : polygone invalide")
 
     def test_aucun_site_dans_la_cellule_dun_autre(self):
-        pts = random_points(12, seed=10)
+        self._check_aucun_site_etranger(random_points(12, seed=10))
+
+    def test_aucun_site_dans_la_cellule_dun_autre_200_points(self):
+        self._check_aucun_site_etranger(random_points(200, seed=10))
+
+    def _check_aucun_site_etranger(self, pts):
         _, _, cells = run_voronoi(pts)
-        for i, poly_i in cells.items():
-            for j, poly_j in cells.items():
-                if i == j:
+        grid, cell = site_grid(pts)
+        arr = np.asarray(pts, dtype=np.float64)
+        for j, poly_j in cells.items():
+            # Seuls les sites des cases recouvertes par la bbox de la cellule
+            # sont candidats : le test point-dans-polygone reste local.
+            poly = np.asarray(poly_j, dtype=np.float64)
+            gx0, gy0 = (poly.min(axis=0) // cell).astype(int).tolist()
+            gx1, gy1 = (poly.max(axis=0) // cell).astype(int).tolist()
+            cand = [i for gx in range(gx0, gx1 + 1) for gy in range(gy0, gy1 + 1)
+                      for i in grid.get((gx, gy), ())]
+            if not cand:
+                continue
+            inside = points_in_polygon(arr[cand], poly)
+            for i in np.asarray(cand)[inside].tolist():
+                if i == j or i not in cells:
                     continue
-                px, py = pts[i]
-                if point_in_polygon(px, py, poly_j):
-                    dx = pts[i][0] - pts[j][0]
-                    dy = pts[i][1] - pts[j][1]
-                    self.assertLess(math.sqrt(dx*dx + dy*dy), 1.0,
-                        f"Site #{i} dans la cellule #{j} (points non quasi-confondus)")
+                dx = pts[i][0] - pts[j][0]
+                dy = pts[i][1] - pts[j][1]
+                self.assertLess(math.sqrt(dx*dx + dy*dy), 1.0,
+                    f"Site #{i} dans la cellule #{j} (points non quasi-confondus)")
+
+    def test_noyau_parallele_identique_a_la_boucle_python(self):
+        import algorithms.voronoi as vmod
+        if not vmod._HAS_NUMBA:
+            self.skipTest("numba non installé")
+        pts = random_points(40, seed=11)
+        tris, bbox, par = run_voronoi(pts)
+        with mock.patch.object(vmod, "PARALLEL", False):
+            seq = compute_voronoi(pts, tris, bbox)
+        self.assertEqual(par.keys(), seq.keys())
+        for i in par:
+            self.assertEqual(len(par[i]), len(seq[i]))
+            for (x1, y1), (x2, y2) in zip(par[i], seq[i]):
+                self.assertTrue(nearly(x1, x2) and nearly(y1, y2))
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -510,6 +776,10 @@ class TestParseTxt(unittest.TestCase):
     def test_espaces_multiples(self):
         self.assertEqual(parse_txt("  1.0   2.0  "), [(1.0, 2.0)])
 
+    def test_separateurs_mixtes(self):
+        self.assertEqual(parse_txt("(1.0; 2.0)\n3.0 , 4.0\n5.0\t6.0"),
+                         [(1.0, 2.0), (3.0, 4.0), (5.0, 6.0)])
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 #  7. visualization.colors
@@ -556,6 +826,10 @@ class TestGenerateColors(unittest.TestCase):
         r, g, b = colors[0]
         self.assertIsInstance(r, float)
 
+    def test_resultat_mis_en_cache(self):
+        self.assertIs(generate_colors(12, palette=Palette.VIVID, seed=3),
+                      generate_colors(12, palette="vivid", seed=3))
+
 
 # ═════════════════════════════════════════════════════════════════════════════
 #  8. Tests d'intégration (pipeline complet)
@@ -604,19 +878,43 @@ class TestIntegration(unittest.TestCase):
         pts = [(float(i * 10), float(j * 10)) for i in range(6) for j in range(6)]
         tris = bowyer_watson(pts)
 
-        violations = sum(
-            1
-            for tri in tris
-            for p in pts
-            if not any(pts_equal(v, p) for v in (tri.a, tri.b, tri.c))
-            and tri.in_circumcircle(p)
-        )
+        idx = site_index(pts)
+        violations = 0
+        for tri in tris:
+            own = {idx[site_key(v)] for v in (tri.a, tri.b, tri.c)}
+            violations += sum(
+                1 for i, p in enumerate(pts)
+                if i not in own and tri.in_circumcircle(p)
+            )
         self.assertEqual(violations, 0)
 
         _, _, cells = run_voronoi(pts)
         self.assertEqual(len(cells), len(pts))
 
 
+# ═════════════════════════════════════════════════════════════════════════════
+#  9. app (dédoublonnage des points)
+# ═════════════════════════════════════════════════════════════════════════════
+
+class TestDeduplicate(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            from app import _deduplicate
+        except ImportError:  # streamlit est requis par app.py
+            raise unittest.SkipTest("streamlit non installé")
+        cls.dedup = staticmethod(_deduplicate)
+
+    def test_doublons_a_1e6_pres_ordre_conserve(self):
+        pts = [(1.0, 2.0), (0.0, 0.0), (1.0 + 1e-9, 2.0), (0.0, 0.0)]
+        self.assertEqual(self.dedup(pts), [(1.0, 2.0), (0.0, 0.0)])
+
+    def test_grandes_coordonnees_non_fusionnees(self):
+        pts = [(1e13, 0.0), (2e13, 0.0), (3e13, 0.0)]
+        self.assertEqual(self.dedup(pts), pts)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 #  Point d'entrée
 # ─────────────────────────────────────────────────────────────────────────────
@@ -1,4 +1,12 @@
 from visualization.colors import generate_colors, Palette
-from visualization.renderer import draw_voronoi, RenderConfig
 
 __all__ = ["generate_colors", "Palette", "draw_voronoi", "RenderConfig"]
+
+
+def __getattr__(name: str):
+    # Import paresseux du rendu : matplotlib n'est chargé qu'à la première
+    # utilisation de draw_voronoi / RenderConfig (pas pour les couleurs seules).
+    if name in ("draw_voronoi", "RenderConfig"):
+        from visualization import renderer
+        return getattr(renderer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
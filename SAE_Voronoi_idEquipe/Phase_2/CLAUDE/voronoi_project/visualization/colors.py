@@ -4,9 +4,10 @@ Génération de palettes de couleurs pour le rendu Voronoï.
 Chaque fonction retourne une liste de n tuples (r, g, b) avec r, g, b ∈ [0, 1].
 """
 
-import colorsys
-import random
 from enum import Enum
+from functools import lru_cache
+
+import numpy as np
 
 
 class Palette(str, Enum):
@@ -29,24 +30,34 @@ _EARTH_BASE: list[tuple] = [
     (0.690, 0.565, 0.376),
     (0.541, 0.439, 0.333),
 ]
+_EARTH_ARR = np.array(_EARTH_BASE, dtype=np.float64)
 
 
 def generate_colors(
     n: int,
     palette: str = Palette.PASTEL,
     seed: int = 42,
-) -> list[tuple]:
+) -> tuple[tuple[float, float, float], ...]:
     """
     Génère n couleurs distinctes selon la palette choisie.
 
+    Le résultat ne dépend que de (n, palette, seed) : il est mis en cache
+    (LRU) et renvoyé sous forme de tuple immuable, partageable sans copie.
+
     Args:
         n      : nombre de couleurs à générer.
         palette: nom de la palette (pastel, vivid, earth, random).
         seed   : graine du générateur aléatoire (reproductibilité).
 
     Returns:
-        Liste de n tuples (r, g, b) avec valeurs dans [0, 1].
+        Tuple de n tuples (r, g, b) avec valeurs dans [0, 1].
     """
+    key = palette.value if isinstance(palette, Palette) else str(palette)
+    return _generate_colors(n, key, seed)
+
+
+@lru_cache(maxsize=64)
+def _generate_colors(n: int, palette: str, seed: int) -> tuple:
     generators = {
         Palette.PASTEL: _pastel,
         Palette.VIVID:  _vivid,
@@ -54,33 +65,61 @@ def generate_colors(
         Palette.RANDOM: _random,
     }
     generator = generators.get(palette, _pastel)
-    return generator(n, seed)
+    return tuple(generator(n, seed))
 
 
 # ── Générateurs de palettes ───────────────────────────────────────────────────
 
 def _pastel(n: int, seed: int) -> list[tuple]:
-    colors = [
-        colorsys.hls_to_rgb(i / max(n, 1), 0.78, 0.65)
-        for i in range(n)
-    ]
-    random.Random(seed).shuffle(colors)
-    return colors
+    return _hue_wheel(n, seed, 0.78, 0.65)
 
 
 def _vivid(n: int, seed: int) -> list[tuple]:
-    colors = [
-        colorsys.hls_to_rgb(i / max(n, 1), 0.55, 0.85)
-        for i in range(n)
-    ]
-    random.Random(seed).shuffle(colors)
-    return colors
+    return _hue_wheel(n, seed, 0.55, 0.85)
 
 
 def _earth(n: int, _seed: int) -> list[tuple]:
-    return [_EARTH_BASE[i % len(_EARTH_BASE)] for i in range(n)]
+    rgb = _EARTH_ARR[np.arange(n) % len(_EARTH_ARR)]
+    return list(map(tuple, rgb.tolist()))
 
 
 def _random(n: int, seed: int) -> list[tuple]:
-    rng = random.Random(seed)
-    return [(rng.random(), rng.random(), rng.random()) for _ in range(n)]
+    rgb = np.random.default_rng(seed).random((n, 3))
+    return list(map(tuple, rgb.tolist()))
+
+
+# ── Helpers privés ────────────────────────────────────────────────────────────
+
+def _hue_wheel(n: int, seed: int, lightness: float, saturation: float) -> list[tuple]:
+    """
+    n teintes régulièrement réparties sur le cercle chromatique, à
+    luminosité et saturation fixes, mélangées selon `seed`.
+
+    Le mélange porte sur les indices de teinte avant conversion : la
+    couleur k est directement celle de la teinte perm[k] / n, sans
+    permuter ensuite les lignes RGB.
+    """
+    perm = np.random.default_rng(seed).permutation(n)
+    rgb = _hls_to_rgb(perm / max(n, 1), lightness, saturation)
+    return list(map(tuple, rgb.tolist()))
+
+
+def _hls_to_rgb(h: np.ndarray, l: float, s: float) -> np.ndarray:
+    """
+    Version vectorisée de `colorsys.hls_to_rgb` (mêmes opérations, mêmes
+    valeurs) pour un tableau de teintes h. Retourne un tableau (n, 3).
+    """
+    if s == 0.0:
+        return np.full((len(h), 3), l)
+    m2 = l * (1.0 + s) if l <= 0.5 else l + s - (l * s)
+    m1 = 2.0 * l - m2
+
+    def channel(hue: np.ndarray) -> np.ndarray:
+        hue = hue % 1.0
+        return np.select(
+            [hue < 1 / 6, hue < 0.5, hue < 2 / 3],
+            [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2 / 3 - hue) * 6.0],
+            m1,
+        )
+
+    return np.stack((channel(h + 1 / 3), channel(h), channel(h - 1 / 3)), axis=1)
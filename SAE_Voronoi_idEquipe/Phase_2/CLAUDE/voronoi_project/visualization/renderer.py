@@ -5,8 +5,9 @@ Rendu matplotlib du diagramme de Voronoï.
 from dataclasses import dataclass, field
 
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.figure import Figure
-from matplotlib.patches import Polygon as MplPolygon
 
 from geometry.triangle import Triangle
 
@@ -31,6 +32,7 @@ def draw_voronoi(
     cells    : dict[int, list[tuple]],
     colors   : list[tuple],
     config   : RenderConfig | None = None,
+    fig      : Figure | None = None,
 ) -> Figure:
     """
     Produit la figure matplotlib du diagramme de Voronoï.
@@ -41,6 +43,8 @@ def draw_voronoi(
         cells    : dictionnaire {index: polygone} des cellules Voronoï.
         colors   : liste de couleurs (r, g, b) indexée par position.
         config   : paramètres visuels (RenderConfig par défaut si None).
+        fig      : figure existante à réutiliser (vidée puis redessinée) ;
+                   évite d'allouer une Figure/un canvas à chaque appel.
 
     Returns:
         Figure matplotlib prête à être affichée ou sauvegardée.
@@ -48,7 +52,11 @@ def draw_voronoi(
     if config is None:
         config = RenderConfig()
 
-    fig, ax = plt.subplots(figsize=(config.fig_size, config.fig_size), dpi=config.dpi)
+    if fig is None:
+        fig, ax = plt.subplots(figsize=(config.fig_size, config.fig_size), dpi=config.dpi)
+    else:
+        fig.clear()
+        ax = fig.add_subplot(111)
     fig.patch.set_facecolor(config.bg_color)
     ax.set_facecolor(config.bg_color)
     ax.set_aspect("equal")
@@ -63,32 +71,38 @@ def draw_voronoi(
         _draw_sites(ax, points, config.site_color)
 
     ax.autoscale_view()
-    plt.tight_layout(pad=0)
+    fig.subplots_adjust(0, 0, 1, 1)   # axes sans cadre : pas de solveur de layout
     return fig
 
 
 # ── Helpers de dessin ─────────────────────────────────────────────────────────
 
 def _draw_cells(ax, cells, colors, config: RenderConfig) -> None:
-    for i, poly_pts in cells.items():
-        if len(poly_pts) < 3:
-            continue
-        color = colors[i % len(colors)]
-        patch = MplPolygon(
-            poly_pts,
-            closed=True,
-            facecolor=(*color, config.cell_alpha),
-            edgecolor=config.edge_color if config.show_edges else "none",
-            linewidth=0.8 if config.show_edges else 0,
-        )
-        ax.add_patch(patch)
+    """Toutes les cellules en un seul artiste (PolyCollection)."""
+    kept = [(i, poly_pts) for i, poly_pts in cells.items() if len(poly_pts) >= 3]
+    if not kept:
+        return
+    verts = [poly_pts for _, poly_pts in kept]
+    facecolors = [(*colors[i % len(colors)], config.cell_alpha) for i, _ in kept]
+    ax.add_collection(PolyCollection(
+        verts,
+        closed=True,
+        facecolors=facecolors,
+        edgecolors=config.edge_color if config.show_edges else "none",
+        linewidths=0.8 if config.show_edges else 0,
+    ))
 
 
 def _draw_delaunay(ax, triangles) -> None:
-    for tri in triangles:
-        xs = [tri.a[0], tri.b[0], tri.c[0], tri.a[0]]
-        ys = [tri.a[1], tri.b[1], tri.c[1], tri.a[1]]
-        ax.plot(xs, ys, color="#ffffff", linewidth=0.4, alpha=0.4, zorder=3)
+    """Les 3 arêtes de chaque triangle en un seul artiste (LineCollection)."""
+    if not triangles:
+        return
+    abc = np.array([(tri.a, tri.b, tri.c) for tri in triangles], dtype=np.float64)
+    # (M, 3, 2) → segments (a,b), (b,c), (c,a) : (3M, 2, 2)
+    segs = np.stack((abc, np.roll(abc, -1, axis=1)), axis=2).reshape(-1, 2, 2)
+    ax.add_collection(LineCollection(
+        segs, colors="#ffffff", linewidths=0.4, alpha=0.4, zorder=3,
+    ))
 
 
 def _draw_sites(ax, points, site_color: str) -> None:
@@ -39,18 +39,23 @@ import os
 import io
 from typing import List, Tuple
 
+import numpy as np
 import streamlit as st
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection, PolyCollection
 
 from geometry.delaunay import compute_delaunay_triangulation
 from geometry.voronoi import build_voronoi_cells
-from geometry.utils import compute_bounding_box
+from geometry.utils import compute_bounding_box, simplify_polygon
 from point_io.json_loader import load_points_from_json
 from point_io.txt_loader import load_points_from_txt
 
 
 Point = Tuple[float, float]
 
+# Tolérance de simplification des cellules, relative à l'étendue des points
+SIMPLIFY_TOLERANCE = 0.002
+
 
 def list_point_files(folder: str) -> List[str]:
     """Retourne la liste des fichiers .json et .txt dans un dossier."""
@@ -63,8 +68,11 @@ def list_point_files(folder: str) -> List[str]:
     return sorted(files)
 
 
-def load_points_from_file(path: str) -> List[Point]:
-    """Charge les points depuis un fichier JSON ou TXT, avec gestion d'erreurs."""
+def load_points_from_file(path: str) -> np.ndarray:
+    """
+    Charge les points depuis un fichier JSON ou TXT, avec gestion d'erreurs.
+    Retourne un tableau (n, 2) de float64.
+    """
     ext = os.path.splitext(path)[1].lower()
     if ext == ".json":
         return load_points_from_json(path)
@@ -75,7 +83,7 @@ def load_points_from_file(path: str) -> List[Point]:
 
 
 def plot_voronoi_and_delaunay(
-    points: List[Point],
+    points: np.ndarray,
     triangles,
     voronoi_cells,
     show_delaunay: bool,
@@ -98,39 +106,83 @@ def plot_voronoi_and_delaunay(
     ax.set_ylim(min_y - margin_y, max_y + margin_y)
     ax.set_aspect("equal", adjustable="box")
 
-    # Affichage des cellules de Voronoï
-    import random
-
-    random.seed(42)
-    for idx, poly in voronoi_cells.items():
-        if len(poly) < 3:
-            continue
-        # Couleur pseudo-aléatoire mais stable
-        random.seed(idx + 123)
-        color = (random.random() * 0.6 + 0.2,
-                 random.random() * 0.6 + 0.2,
-                 random.random() * 0.6 + 0.2)
-        xs = [p[0] for p in poly]
-        ys = [p[1] for p in poly]
-        ax.fill(xs, ys, color=color, alpha=0.6, edgecolor="k", linewidth=0.5)
-
-    # Affichage des points
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    ax.scatter(xs, ys, color="black", s=20, zorder=5)
-
-    # Optionnel : triangulation de Delaunay
-    if show_delaunay:
-        for tri in triangles:
-            i, j, k = tri.vertices
-            x_tri = [points[i][0], points[j][0], points[k][0], points[i][0]]
-            y_tri = [points[i][1], points[j][1], points[k][1], points[i][1]]
-            ax.plot(x_tri, y_tri, color="blue", linewidth=0.8, alpha=0.7)
+    # Affichage des cellules de Voronoï : un seul artiste pour toutes les cellules.
+    # Couleurs pseudo-aléatoires mais stables : tirées en un bloc (une ligne
+    # par site, graine fixe) puis indexées par numéro de site.
+    # Les cellules sont simplifiées (Douglas–Peucker) à ~1 pixel près :
+    # tolérance de 0,2 % de la plus grande dimension des points.
+    palette = np.random.default_rng(42).uniform(0.2, 0.8, (len(points), 3))
+    tol = SIMPLIFY_TOLERANCE * max(max_x - min_x, max_y - min_y)
+    kept = [(idx, simplify_polygon(poly, tol))
+            for idx, poly in voronoi_cells.items() if len(poly) >= 3]
+    ax.add_collection(PolyCollection(
+        [poly for _, poly in kept],
+        facecolors=palette[[idx for idx, _ in kept]],
+        edgecolors="k", alpha=0.6, linewidths=0.5,
+    ))
+
+    # Affichage des points (colonnes x et y du tableau)
+    ax.scatter(points[:, 0], points[:, 1], color="black", s=20, zorder=5)
+
+    # Optionnel : triangulation de Delaunay, les 3 arêtes de chaque triangle
+    # regroupées en un seul LineCollection
+    if show_delaunay and triangles:
+        corners = points[np.array([tri.vertices for tri in triangles])]   # (T, 3, 2)
+        segments = np.stack((corners, np.roll(corners, -1, axis=1)), axis=2)
+        ax.add_collection(LineCollection(
+            segments.reshape(-1, 2, 2), colors="blue", linewidths=0.8, alpha=0.7,
+        ))
 
     ax.set_title("Diagramme de Voronoï (et triangulation de Delaunay optionnelle)")
     return fig
 
 
+# Calculs mis en cache entre les reruns Streamlit : la clé (chemin, mtime)
+# change dès que le fichier est modifié, et cocher une option d'affichage ne
+# relance ni la triangulation ni la construction des cellules. La figure
+# matplotlib, objet mutable, n'est pas partagée : chaque exécution construit
+# la sienne à partir de ces données.
+
+@st.cache_data(show_spinner=False)
+def _cached_points(path: str, mtime: float) -> np.ndarray:
+    return load_points_from_file(path)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_triangulation(path: str, mtime: float) -> list:
+    return compute_delaunay_triangulation(_cached_points(path, mtime))
+
+
+@st.cache_data(show_spinner=False)
+def _cached_voronoi(path: str, mtime: float) -> dict:
+    points = _cached_points(path, mtime)
+    return build_voronoi_cells(points, _cached_triangulation(path, mtime))
+
+
+def _export_figure(fig) -> Tuple[bytes, bytes]:
+    """
+    Rend la figure en PNG et en SVG. La bbox serrée est calculée une seule
+    fois et passée aux deux `savefig` (équivalent de bbox_inches="tight",
+    marge de 0,1 pouce comprise).
+    """
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+    exports = []
+    for fmt in ("png", "svg"):
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, bbox_inches=bbox)
+        exports.append(buffer.getvalue())
+    return exports[0], exports[1]
+
+
+@st.cache_data(show_spinner=False)
+def _cached_exports(path: str, mtime: float, show_delaunay: bool,
+                    _fig) -> Tuple[bytes, bytes]:
+    # Le rendu SVG des cellules domine l'export : il n'est refait que si la
+    # figure change. `_fig`, la figure de l'exécution courante, n'entre pas
+    # dans la clé du cache.
+    return _export_figure(_fig)
+
+
 def main():
     st.set_page_config(page_title="Voronoï / Delaunay - Watson", layout="wide")
     st.title("Diagramme de Voronoï à partir de la triangulation de Delaunay (Watson)")
@@ -159,12 +211,13 @@ def main():
     show_delaunay = st.sidebar.checkbox("Afficher la triangulation de Delaunay", value=True)
 
     full_path = os.path.join(folder, selected_file)
+    mtime = os.path.getmtime(full_path)
 
     st.write(f"**Fichier sélectionné :** `{selected_file}`")
 
     # Chargement des points
     try:
-        points = load_points_from_file(full_path)
+        points = _cached_points(full_path, mtime)
     except Exception as e:
         st.error(f"Erreur lors du chargement des points : {e}")
         return
@@ -177,13 +230,13 @@ def main():
 
     # Calcul Delaunay + Voronoï
     try:
-        triangles = compute_delaunay_triangulation(points)
+        triangles = _cached_triangulation(full_path, mtime)
     except Exception as e:
         st.error(f"Erreur lors du calcul de la triangulation de Delaunay : {e}")
         return
 
     try:
-        voronoi_cells = build_voronoi_cells(points, triangles)
+        voronoi_cells = _cached_voronoi(full_path, mtime)
     except Exception as e:
         st.error(f"Erreur lors de la construction du diagramme de Voronoï : {e}")
         return
@@ -200,28 +253,26 @@ def main():
     with col_dl:
         st.subheader("Export")
 
+        png_bytes, svg_bytes = _cached_exports(full_path, mtime, show_delaunay, fig)
+
         # PNG
-        png_buffer = io.BytesIO()
-        fig.savefig(png_buffer, format="png", bbox_inches="tight")
-        png_buffer.seek(0)
         st.download_button(
             label="Télécharger PNG",
-            data=png_buffer,
+            data=png_bytes,
             file_name="voronoi.png",
             mime="image/png",
         )
 
         # SVG
-        svg_buffer = io.BytesIO()
-        fig.savefig(svg_buffer, format="svg", bbox_inches="tight")
-        svg_buffer.seek(0)
         st.download_button(
             label="Télécharger SVG",
-            data=svg_buffer,
+            data=svg_bytes,
             file_name="voronoi.svg",
             mime="image/svg+xml",
         )
 
+    plt.close(fig)
+
 
 if __name__ == "__main__":
     main()
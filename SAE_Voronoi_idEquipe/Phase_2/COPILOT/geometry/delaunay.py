@@ -4,29 +4,51 @@ Triangulation de Delaunay 2D via l'algorithme de Watson (insertion incrémentale
 Étapes principales :
 - Construction d'un super-triangle englobant tous les points.
 - Insertion des points un par un :
-    - Recherche des triangles dont le cercle circonscrit contient le point (cavity).
+    - Recherche des triangles dont le cercle circonscrit contient le point (cavity),
+      limitée aux candidats fournis par une grille uniforme sur les cercles,
+      testés en une seule expression NumPy.
     - Suppression de ces triangles.
     - Construction du polygone frontière de la cavité (edges uniques).
     - Création de nouveaux triangles reliant le point aux arêtes de la cavité.
 - Suppression des triangles qui utilisent les sommets du super-triangle.
 """
 
+import math
 from dataclasses import dataclass
 from typing import List, Tuple, Dict, Set
 
-from .utils import compute_bounding_box, circumcircle, point_in_circumcircle
+import numpy as np
+
+from .jit_utils import HAS_NUMBA, circumcircle_xy, in_circumcircle_xy, njit, prange
+from .utils import compute_bounding_box, circumcircle
 
 Point = Tuple[float, float]
 
+# Nombre de triangles à partir duquel le noyau Numba répartit le test des
+# cercles sur plusieurs cœurs (en dessous, le lancement des threads coûte
+# plus cher que le balayage lui-même).
+PARALLEL_SCAN_MIN = 8192
+
 
-@dataclass
+@dataclass(slots=True)
 class Triangle:
+    """
+    Triangle de la triangulation retournée. Pendant l'insertion, les
+    triangles n'existent que sous forme de tableaux parallèles (sommets
+    int32 (n, 3), cx, cy, r2 float64) ; un Triangle n'est créé qu'à la
+    sortie, par triangle final. `slots=True` : pas de __dict__ par objet.
+    """
+
     vertices: Tuple[int, int, int]
     circumcenter: Point
     radius_sq: float
+    # neighbors[k] : indice (dans la liste retournée) du triangle opposé au
+    # sommet k, c'est-à-dire partageant l'arête (vertices[k+1], vertices[k+2]) ;
+    # -1 si cette arête est sur l'enveloppe convexe.
+    neighbors: Tuple[int, int, int] = (-1, -1, -1)
 
 
-def _build_super_triangle(points: List[Point]) -> Tuple[Point, Point, Point]:
+def _build_super_triangle(points) -> Tuple[Point, Point, Point]:
     """
     Construit un super-triangle englobant tous les points.
     On prend un grand triangle équilatéral couvrant la bounding box.
@@ -48,83 +70,417 @@ def _build_super_triangle(points: List[Point]) -> Tuple[Point, Point, Point]:
     return p1, p2, p3
 
 
-def compute_delaunay_triangulation(points: List[Point]) -> List[Triangle]:
+class _CircumcircleGrid:
+    """
+    Index spatial des triangles par leur cercle circonscrit.
+
+    Grille uniforme de pas `cell_size` : chaque triangle est inscrit dans toutes
+    les cases recouvertes par la bbox de son cercle [cx - r, cx + r] x [cy - r, cy + r].
+    Les candidats pour un point p sont donc les triangles de la seule case de p.
+    Les très grands cercles (plus de MAX_CELLS cases) sont gardés à part et
+    toujours testés : il y en a peu (triangles reliés au super-triangle).
+
+    L'emprise calculée à l'insertion est mémorisée par triangle : le retrait
+    la relit au lieu de recalculer le cercle (racine carrée et arrondis).
+    """
+
+    MAX_CELLS = 64
+
+    def __init__(self, cell_size: float) -> None:
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Set[int]] = {}
+        self.large: Set[int] = set()
+        self.spans: Dict[int, Tuple[int, int, int, int]] = {}
+
+    def _span(self, cx: float, cy: float, r2: float) -> Tuple[int, int, int, int]:
+        r = math.sqrt(r2)
+        s = self.cell_size
+        return (math.floor((cx - r) / s), math.floor((cy - r) / s),
+                math.floor((cx + r) / s), math.floor((cy + r) / s))
+
+    def insert(self, t_id: int, cx: float, cy: float, r2: float) -> None:
+        i0, j0, i1, j1 = span = self._span(cx, cy, r2)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > self.MAX_CELLS:
+            self.large.add(t_id)
+            return
+        self.spans[t_id] = span
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                self.cells.setdefault((i, j), set()).add(t_id)
+
+    def remove(self, t_id: int) -> None:
+        if t_id in self.large:
+            self.large.discard(t_id)
+            return
+        i0, j0, i1, j1 = self.spans.pop(t_id)
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                self.cells[(i, j)].discard(t_id)
+
+    def candidates(self, p: Point) -> List[int]:
+        s = self.cell_size
+        key = (math.floor(p[0] / s), math.floor(p[1] / s))
+        return [*self.cells.get(key, ()), *self.large]
+
+
+class _TriangleArrays:
+    """
+    Stockage SoA des triangles pendant l'insertion : sommets (cap, 3) et
+    cercles circonscrits en tableaux parallèles `cx`, `cy`, `r2`, plus un
+    masque `alive`. L'identifiant d'un triangle est sa ligne ; la capacité
+    double quand elle est atteinte.
+
+    Les lignes des triangles supprimés sont empilées dans `free` et
+    réutilisées par les ajouts suivants : le tableau reste de la taille de
+    la triangulation courante au lieu de croître à chaque insertion.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.size = 0
+        self.vertices = np.empty((capacity, 3), dtype=np.int32)
+        self.cx = np.empty(capacity, dtype=np.float64)
+        self.cy = np.empty(capacity, dtype=np.float64)
+        self.r2 = np.empty(capacity, dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.free: List[int] = []
+
+    def add(self, a: int, b: int, c: int, cx: float, cy: float, r2: float) -> int:
+        if self.free:
+            t_id = self.free.pop()
+        else:
+            t_id = self.size
+            if t_id == len(self.cx):
+                self._grow()
+            self.size += 1
+        self.vertices[t_id] = (a, b, c)
+        self.cx[t_id] = cx
+        self.cy[t_id] = cy
+        self.r2[t_id] = r2
+        self.alive[t_id] = True
+        return t_id
+
+    def remove(self, ids: np.ndarray) -> None:
+        self.alive[ids] = False
+        self.free.extend(ids.tolist())
+
+    def _grow(self) -> None:
+        cap = 2 * len(self.cx)
+        for name in ("vertices", "cx", "cy", "r2", "alive"):
+            old = getattr(self, name)
+            new = np.zeros((cap,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def in_circumcircle(self, ids: np.ndarray, p: Point) -> np.ndarray:
+        """Sous-ensemble de `ids` dont le cercle contient p (un seul test vectorisé)."""
+        dx = self.cx[ids] - p[0]
+        dy = self.cy[ids] - p[1]
+        return ids[dx * dx + dy * dy <= self.r2[ids] * (1 + 1e-12)]
+
+
+def _hilbert_order(coords: np.ndarray, order: int = 16) -> np.ndarray:
+    """
+    Permutation qui trie les points selon leur indice sur une courbe de
+    Hilbert d'ordre `order` (grille 2^order x 2^order sur la bbox).
+    Deux points consécutifs dans cet ordre sont proches : chaque insertion
+    tombe près de la précédente et sa cavité reste petite.
+    Calcul vectorisé, un niveau de la courbe par itération.
+    """
+    n = 1 << order
+    min_x, min_y, max_x, max_y = compute_bounding_box(coords)
+    span = max(max_x - min_x, max_y - min_y) or 1.0
+    x = ((coords[:, 0] - min_x) * ((n - 1) / span)).astype(np.int64)
+    y = ((coords[:, 1] - min_y) * ((n - 1) / span)).astype(np.int64)
+    d = np.zeros(len(coords), dtype=np.int64)
+    s = n // 2
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        # Rotation du quadrant pour que la sous-courbe s'enchaîne
+        flip = ~ry & rx
+        x = np.where(flip, n - 1 - x, x)
+        y = np.where(flip, n - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s //= 2
+    return np.argsort(d, kind="stable")
+
+
+def _brio_order(coords: np.ndarray, first_round: int = 64) -> np.ndarray:
+    """
+    Ordre d'insertion BRIO : points mélangés (graine fixe), découpés en
+    tours de taille doublante, chaque tour trié selon `_hilbert_order`.
+
+    Le mélange garde l'enveloppe établie tôt (peu de triangles reliés au
+    super-triangle, dont les grands cercles sont toujours candidats) ;
+    le tri de Hilbert rend les insertions d'un même tour voisines.
+    """
+    n = len(coords)
+    shuffled = np.random.default_rng(0).permutation(n)
+    rounds = []
+    lo, hi = 0, min(n, first_round)
+    while lo < n:
+        idx = shuffled[lo:hi]
+        rounds.append(idx[_hilbert_order(coords[idx])])
+        lo, hi = hi, min(n, 2 * hi)
+    return np.concatenate(rounds)
+
+
+def _build_grid(tris: _TriangleArrays) -> _CircumcircleGrid:
+    """
+    (Re)construit la grille, avec un pas égal au rayon circonscrit médian
+    des triangles courants.
+    """
+    ids = np.flatnonzero(tris.alive[:tris.size])
+    cell_size = math.sqrt(float(np.median(tris.r2[ids]))) or 1.0
+    grid = _CircumcircleGrid(cell_size)
+    for t_id, cx, cy, r2 in zip(ids.tolist(), tris.cx[ids].tolist(),
+                                tris.cy[ids].tolist(), tris.r2[ids].tolist()):
+        grid.insert(t_id, cx, cy, r2)
+    return grid
+
+
+def _triangle_neighbors(vertices: np.ndarray) -> np.ndarray:
+    """
+    Adjacence (T, 3) des triangles : neighbors[t, k] est le triangle qui
+    partage l'arête opposée au sommet k de t, ou -1 sur l'enveloppe.
+    Les 3T arêtes sont codées par une clé entière (min, max) et triées :
+    une arête intérieure apparaît exactement deux fois, côte à côte.
+    """
+    n_tri = len(vertices)
+    a = vertices[:, [1, 2, 0]].ravel().astype(np.int64)
+    b = vertices[:, [2, 0, 1]].ravel().astype(np.int64)
+    keys = np.minimum(a, b) * (int(vertices.max(initial=0)) + 1) + np.maximum(a, b)
+    order = np.argsort(keys, kind="stable")
+    shared = keys[order[1:]] == keys[order[:-1]]
+    first, second = order[:-1][shared], order[1:][shared]
+    neighbors = np.full(3 * n_tri, -1, dtype=np.int64)
+    neighbors[first] = second // 3
+    neighbors[second] = first // 3
+    return neighbors.reshape(n_tri, 3)
+
+
+def compute_delaunay_triangulation(points) -> List[Triangle]:
     """
-    Calcule la triangulation de Delaunay d'une liste de points 2D
-    en utilisant l'algorithme de Watson (insertion incrémentale).
+    Calcule la triangulation de Delaunay d'un ensemble de points 2D
+    (tableau (n, 2) ou liste de tuples) en utilisant l'algorithme de Watson
+    (insertion incrémentale).
     Retourne une liste de Triangle (indices par rapport à la liste de points d'origine).
+
+    Si Numba est installé, toute la boucle d'insertion s'exécute dans un seul
+    noyau compilé (`_watson`) ; sinon, version Python avec grille (`_watson_grid`).
+    Les points sont insérés dans l'ordre BRIO (`_brio_order`), puis les
+    indices des triangles sont ramenés à l'ordre d'origine.
+    Chaque Triangle porte aussi ses voisins (`Triangle.neighbors`), calculés
+    une fois sur les tableaux finaux.
     """
     if len(points) < 3:
         return []
 
-    # Copie des points pour pouvoir ajouter les sommets du super-triangle
-    pts = list(points)
+    # Coordonnées des points, complétées par les sommets du super-triangle
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    n_points = len(coords)
+    perm = _brio_order(coords)
+    coords = coords[perm]
+    coords = np.concatenate((coords, _build_super_triangle(coords)))
 
-    # Construction du super-triangle
-    st_p1, st_p2, st_p3 = _build_super_triangle(pts)
-    idx_st1 = len(pts)
-    idx_st2 = len(pts) + 1
-    idx_st3 = len(pts) + 2
-    pts.extend([st_p1, st_p2, st_p3])
+    if HAS_NUMBA:
+        vertices, cx, cy, r2 = _watson(coords, n_points, PARALLEL_SCAN_MIN)
+    else:
+        vertices, cx, cy, r2 = _watson_grid(coords.tolist(), n_points)
 
-    # Triangles initiaux : le super-triangle
-    cx, cy, r2 = circumcircle(st_p1, st_p2, st_p3)
-    triangles: List[Triangle] = [
-        Triangle(vertices=(idx_st1, idx_st2, idx_st3),
-                 circumcenter=(cx, cy),
-                 radius_sq=r2)
+    # 5. Supprimer les triangles qui contiennent un sommet du super-triangle
+    ids = np.flatnonzero((vertices < n_points).all(axis=1))
+    vertices = perm[vertices[ids]]
+    neighbors = _triangle_neighbors(vertices)
+    return [
+        Triangle(vertices=tuple(v), circumcenter=(x, y), radius_sq=rr,
+                 neighbors=tuple(nb))
+        for v, x, y, rr, nb in zip(vertices.tolist(), cx[ids].tolist(),
+                                   cy[ids].tolist(), r2[ids].tolist(),
+                                   neighbors.tolist())
     ]
 
+
+def _watson_grid(pts: List[List[float]], n_points: int):
+    """
+    Boucle d'insertion en Python : candidats par la grille de cercles,
+    test vectorisé, triangles en tableaux SoA.
+    `pts` contient les n_points points puis les 3 sommets du super-triangle.
+    Retourne (vertices, cx, cy, r2) des triangles vivants.
+    """
+    idx_st1, idx_st2, idx_st3 = n_points, n_points + 1, n_points + 2
+
+    # Triangles initiaux : le super-triangle
+    tris = _TriangleArrays(2 * n_points + 16)
+    tris.add(idx_st1, idx_st2, idx_st3,
+             *circumcircle(pts[idx_st1], pts[idx_st2], pts[idx_st3]))
+    grid = _build_grid(tris)
+    grid_size = 1
+
     # Insertion incrémentale des points originaux
-    for idx_p, p in enumerate(points):
-        bad_triangles: List[int] = []
+    for idx_p in range(n_points):
+        p = pts[idx_p]
+        # La grille est reconstruite (nouveau pas) quand le nombre de
+        # triangles a doublé depuis la dernière construction.
+        n_alive = tris.size - len(tris.free)
+        if n_alive >= 2 * grid_size:
+            grid = _build_grid(tris)
+            grid_size = n_alive
 
         # 1. Trouver les triangles dont le cercle circonscrit contient le point
-        for t_idx, tri in enumerate(triangles):
-            if point_in_circumcircle(p, tri.circumcenter, tri.radius_sq):
-                bad_triangles.append(t_idx)
+        candidates = np.fromiter(grid.candidates(p), dtype=np.int64)
+        bad_triangles = tris.in_circumcircle(candidates, p)
 
-        if not bad_triangles:
+        if not len(bad_triangles):
             # Aucun triangle ne contient ce point (cas rare), on ignore
             continue
 
         # 2. Récupérer les arêtes de la cavité
-        # Chaque arête est un tuple (i, j) avec i < j pour normaliser
-        edge_count: Dict[Tuple[int, int], int] = {}
+        # Chaque arête est un tuple (i, j) avec i < j pour normaliser.
+        # Bascule dans un ensemble : une arête vue deux fois est intérieure
+        # et ressort ; il ne reste que les arêtes frontières.
+        boundary_edges: Set[Tuple[int, int]] = set()
 
-        for t_idx in bad_triangles:
-            tri = triangles[t_idx]
-            v = tri.vertices
+        for v in tris.vertices[bad_triangles].tolist():
             edges = [(v[0], v[1]), (v[1], v[2]), (v[2], v[0])]
             for (a, b) in edges:
-                if a > b:
-                    a, b = b, a
-                edge = (a, b)
-                edge_count[edge] = edge_count.get(edge, 0) + 1
-
-        # Les arêtes frontières sont celles qui apparaissent exactement une fois
-        boundary_edges = [e for e, c in edge_count.items() if c == 1]
+                edge = (a, b) if a < b else (b, a)
+                if edge in boundary_edges:
+                    boundary_edges.remove(edge)
+                else:
+                    boundary_edges.add(edge)
 
-        # 3. Supprimer les triangles "mauvais"
-        bad_triangles_set: Set[int] = set(bad_triangles)
-        triangles = [tri for i, tri in enumerate(triangles) if i not in bad_triangles_set]
+        # 3. Supprimer les triangles "mauvais" (masque et grille)
+        tris.remove(bad_triangles)
+        for t_idx in bad_triangles.tolist():
+            grid.remove(t_idx)
 
         # 4. Créer de nouveaux triangles reliant le point aux arêtes frontières
+        px, py = p
         for (a, b) in boundary_edges:
-            cx, cy, r2 = circumcircle(pts[a], pts[b], p)
-            new_tri = Triangle(
-                vertices=(a, b, idx_p),
-                circumcenter=(cx, cy),
-                radius_sq=r2,
-            )
-            triangles.append(new_tri)
+            (ax, ay), (bx, by) = pts[a], pts[b]
+            cx, cy, r2 = circumcircle_xy(ax, ay, bx, by, px, py)
+            grid.insert(tris.add(a, b, idx_p, cx, cy, r2), cx, cy, r2)
 
-    # 5. Supprimer les triangles qui contiennent un sommet du super-triangle
-    super_indices = {idx_st1, idx_st2, idx_st3}
-    final_triangles: List[Triangle] = []
-    for tri in triangles:
-        if any(v in super_indices for v in tri.vertices):
+    ids = np.flatnonzero(tris.alive[:tris.size])
+    return tris.vertices[ids], tris.cx[ids], tris.cy[ids], tris.r2[ids]
+
+
+@njit(cache=True)
+def _watson(coords: np.ndarray, n_points: int, scan_min: int):
+    """
+    Boucle d'insertion complète en un seul noyau (compilé par Numba).
+
+    Les triangles vivants sont gardés compacts dans des tableaux de capacité
+    fixe (agrandis si besoin) : un triangle supprimé est remplacé par le
+    dernier, et le test des cercles balaie exactement les `t` triangles
+    vivants. Les arêtes de la cavité sont comptées par bascule dans un petit
+    tableau (une arête vue deux fois est intérieure et disparaît).
+    `coords` contient les n_points points puis les 3 sommets du super-triangle.
+    `scan_min` : nombre de triangles à partir duquel le test des cercles est
+    réparti sur les cœurs (PARALLEL_SCAN_MIN).
+    Retourne (vertices, cx, cy, r2) des triangles vivants.
+    """
+    cap = 2 * n_points + 16
+    vertices = np.empty((cap, 3), dtype=np.int32)
+    cx = np.empty(cap, dtype=np.float64)
+    cy = np.empty(cap, dtype=np.float64)
+    r2 = np.empty(cap, dtype=np.float64)
+    bad = np.empty(cap, dtype=np.int64)
+    mask = np.empty(cap, dtype=np.uint8)
+    edges = np.empty((3 * cap, 2), dtype=np.int32)
+
+    s1, s2, s3 = n_points, n_points + 1, n_points + 2
+    vertices[0, 0], vertices[0, 1], vertices[0, 2] = s1, s2, s3
+    cx[0], cy[0], r2[0] = circumcircle_xy(coords[s1, 0], coords[s1, 1],
+                                          coords[s2, 0], coords[s2, 1],
+                                          coords[s3, 0], coords[s3, 1])
+    t = 1
+
+    for ip in range(n_points):
+        px, py = coords[ip, 0], coords[ip, 1]
+
+        # 1. Triangles dont le cercle circonscrit contient le point.
+        #    Le test est sans branchement (comparaison de distances, pas de
+        #    réorientation du triangle). La compaction garde son `if` (test
+        #    rarement vrai). Au-delà de `scan_min` triangles, le test est
+        #    d'abord réparti sur les cœurs (`_mark_bad`), puis compacté ici.
+        nb = 0
+        if t >= scan_min:
+            _mark_bad(px, py, cx, cy, r2, t, mask)
+            for i in range(t):
+                if mask[i]:
+                    bad[nb] = i
+                    nb += 1
+        else:
+            for i in range(t):
+                if in_circumcircle_xy(px, py, cx[i], cy[i], r2[i]):
+                    bad[nb] = i
+                    nb += 1
+        if nb == 0:
             continue
-        final_triangles.append(tri)
 
-    return final_triangles
+        # 2. Arêtes frontières (i < j) : bascule présente / absente
+        ne = 0
+        for k in range(nb):
+            for e in range(3):
+                a = vertices[bad[k], e]
+                b = vertices[bad[k], (e + 1) % 3]
+                if a > b:
+                    a, b = b, a
+                found = -1
+                for q in range(ne):
+                    if edges[q, 0] == a and edges[q, 1] == b:
+                        found = q
+                        break
+                if found >= 0:
+                    ne -= 1
+                    edges[found, 0] = edges[ne, 0]
+                    edges[found, 1] = edges[ne, 1]
+                else:
+                    edges[ne, 0] = a
+                    edges[ne, 1] = b
+                    ne += 1
+
+        # 3. Supprimer les triangles "mauvais" (indices décroissants : le
+        #    dernier triangle vivant vient boucher chaque trou)
+        for k in range(nb - 1, -1, -1):
+            i = bad[k]
+            t -= 1
+            vertices[i] = vertices[t]
+            cx[i], cy[i], r2[i] = cx[t], cy[t], r2[t]
+
+        # 4. Nouveaux triangles reliant le point aux arêtes frontières
+        if t + ne > vertices.shape[0]:
+            cap = 2 * (t + ne)
+            vertices = _grow(vertices, cap)
+            cx, cy, r2 = _grow(cx, cap), _grow(cy, cap), _grow(r2, cap)
+            bad = np.empty(cap, dtype=np.int64)
+            mask = np.empty(cap, dtype=np.uint8)
+            edges = _grow(edges, 3 * cap)
+        for q in range(ne):
+            a, b = edges[q, 0], edges[q, 1]
+            vertices[t, 0], vertices[t, 1], vertices[t, 2] = a, b, ip
+            cx[t], cy[t], r2[t] = circumcircle_xy(coords[a, 0], coords[a, 1],
+                                                  coords[b, 0], coords[b, 1],
+                                                  px, py)
+            t += 1
+
+    return vertices[:t], cx[:t], cy[:t], r2[:t]
+
+
+@njit(cache=True, parallel=True)
+def _mark_bad(px: float, py: float, cx: np.ndarray, cy: np.ndarray,
+              r2: np.ndarray, t: int, mask: np.ndarray) -> None:
+    """mask[i] = 1 si le cercle du triangle i (i < t) contient p ; boucle prange."""
+    for i in prange(t):
+        mask[i] = in_circumcircle_xy(px, py, cx[i], cy[i], r2[i])
+
+
+@njit(cache=True)
+def _grow(arr: np.ndarray, cap: int) -> np.ndarray:
+    """Copie de `arr` dans un tableau de `cap` lignes."""
+    out = np.empty((cap,) + arr.shape[1:], dtype=arr.dtype)
+    out[:len(arr)] = arr
+    return out
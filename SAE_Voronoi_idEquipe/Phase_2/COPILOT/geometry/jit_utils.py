@@ -0,0 +1,56 @@
+"""
+Versions scalaires « à plat » des prédicats géométriques, compilables par Numba.
+
+Les arguments sont des flottants séparés (ax, ay, bx, by, ...) plutôt que des
+tuples : pas de déballage, et les fonctions peuvent être appelées telles
+quelles depuis d'autres noyaux @njit. Si Numba n'est pas installé, ce sont
+de simples fonctions Python aux résultats identiques.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # numba est optionnel : repli en Python pur
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*_args, **_kwargs):
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def orientation_xy(ax: float, ay: float, bx: float, by: float,
+                   cx: float, cy: float) -> float:
+    """Double de l'aire signée de (a, b, c) : > 0 si le triangle est direct."""
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+@njit(cache=True)
+def circumcircle_xy(ax: float, ay: float, bx: float, by: float,
+                    cx: float, cy: float):
+    """
+    Cercle circonscrit à (a, b, c) : (centre_x, centre_y, rayon_carré).
+    Points quasi colinéaires : centre moyen et rayon « infini » (1e30).
+    """
+    d = 2.0 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+
+    if abs(d) < 1e-12:
+        return (ax + bx + cx) / 3.0, (ay + by + cy) / 3.0, 1e30
+
+    a2 = ax * ax + ay * ay
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+
+    ux = (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / d
+    uy = (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / d
+
+    return ux, uy, (ux - ax) ** 2 + (uy - ay) ** 2
+
+
+@njit(cache=True)
+def in_circumcircle_xy(px: float, py: float, cx: float, cy: float,
+                       radius_sq: float) -> bool:
+    """p est dans le cercle de centre (cx, cy), avec une marge relative de 1e-12."""
+    dx = px - cx
+    dy = py - cy
+    return dx * dx + dy * dy <= radius_sq * (1 + 1e-12)
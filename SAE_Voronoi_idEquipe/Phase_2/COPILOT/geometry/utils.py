@@ -1,13 +1,21 @@
 from typing import Tuple, List
 
+import numpy as np
+
+from .jit_utils import circumcircle_xy, in_circumcircle_xy, orientation_xy
+
 Point = Tuple[float, float]
 
 
-def compute_bounding_box(points: List[Point]) -> Tuple[float, float, float, float]:
-    """Retourne (min_x, min_y, max_x, max_y) pour une liste de points."""
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    return min(xs), min(ys), max(xs), max(ys)
+def compute_bounding_box(points) -> Tuple[float, float, float, float]:
+    """
+    Retourne (min_x, min_y, max_x, max_y) pour des points donnés en tableau
+    (n, 2) ou en liste de tuples. Réductions NumPy sur les colonnes x et y
+    (plus rapides que `pts.min(axis=0)` sur un axe interne de 2).
+    """
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    px, py = pts[:, 0], pts[:, 1]
+    return float(px.min()), float(py.min()), float(px.max()), float(py.max())
 
 
 def circumcircle(p1: Point, p2: Point, p3: Point):
@@ -17,37 +25,15 @@ def circumcircle(p1: Point, p2: Point, p3: Point):
 
     Si les points sont colinéaires, retourne un cercle très grand
     (centre moyen, rayon énorme) pour éviter les problèmes numériques.
+    Le calcul est fait par `circumcircle_xy` (compilé si Numba est présent).
     """
     (x1, y1), (x2, y2), (x3, y3) = p1, p2, p3
+    return circumcircle_xy(x1, y1, x2, y2, x3, y3)
 
-    # Formule classique basée sur les déterminants
-    d = 2 * (
-        x1 * (y2 - y3)
-        + x2 * (y3 - y1)
-        + x3 * (y1 - y2)
-    )
-
-    if abs(d) < 1e-12:
-        # Points quasi colinéaires : on renvoie un cercle "infini"
-        cx = (x1 + x2 + x3) / 3.0
-        cy = (y1 + y2 + y3) / 3.0
-        r2 = 1e30
-        return cx, cy, r2
-
-    ux = (
-        (x1**2 + y1**2) * (y2 - y3)
-        + (x2**2 + y2**2) * (y3 - y1)
-        + (x3**2 + y3**2) * (y1 - y2)
-    ) / d
-
-    uy = (
-        (x1**2 + y1**2) * (x3 - x2)
-        + (x2**2 + y2**2) * (x1 - x3)
-        + (x3**2 + y3**2) * (x2 - x1)
-    ) / d
 
-    r2 = (ux - x1) ** 2 + (uy - y1) ** 2
-    return ux, uy, r2
+def orientation(a: Point, b: Point, c: Point) -> float:
+    """Double de l'aire signée de (a, b, c) : > 0 si a, b, c tournent dans le sens direct."""
+    return orientation_xy(a[0], a[1], b[0], b[1], c[0], c[1])
 
 
 def point_in_circumcircle(point: Point, center: Point, radius_sq: float) -> bool:
@@ -55,7 +41,57 @@ def point_in_circumcircle(point: Point, center: Point, radius_sq: float) -> bool
     Teste si un point est strictement à l'intérieur du cercle circonscrit.
     On autorise une petite marge pour les erreurs numériques.
     """
-    dx = point[0] - center[0]
-    dy = point[1] - center[1]
-    dist_sq = dx * dx + dy * dy
-    return dist_sq <= radius_sq * (1 + 1e-12)
+    return in_circumcircle_xy(point[0], point[1], center[0], center[1], radius_sq)
+
+
+def simplify_polygon(polygon, tol: float) -> List[Point]:
+    """
+    Simplifie un polygone fermé (liste de sommets ou tableau (k, 2)) par
+    Douglas–Peucker : un sommet est gardé s'il s'écarte de plus de `tol` de
+    la corde entre les sommets retenus.
+    L'anneau est coupé entre le sommet 0 et le sommet le plus éloigné de
+    lui, puis chaque chaîne est simplifiée (pile explicite, sans récursion).
+    Retourne le polygone d'origine si le résultat a moins de 3 sommets.
+    """
+    if isinstance(polygon, np.ndarray):
+        # Flottants Python : l'accès élément par élément d'un tableau est lent
+        polygon = polygon.tolist()
+    n = len(polygon)
+    if n <= 3 or tol <= 0:
+        return list(polygon)
+
+    x0, y0 = polygon[0]
+    far = max(range(1, n),
+              key=lambda k: (polygon[k][0] - x0) ** 2 + (polygon[k][1] - y0) ** 2)
+    ring = list(polygon) + [polygon[0]]
+    keep = [False] * (n + 1)
+    keep[0] = keep[far] = True
+    tol_sq = tol * tol
+
+    stack = [(0, far), (far, n)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        ax, ay = ring[i]
+        dx = ring[j][0] - ax
+        dy = ring[j][1] - ay
+        length_sq = dx * dx + dy * dy
+        best, best_k = -1.0, -1
+        for k in range(i + 1, j):
+            ex = ring[k][0] - ax
+            ey = ring[k][1] - ay
+            if length_sq > 0:
+                # Distance au carré à la droite portant la corde
+                d_sq = (dx * ey - dy * ex) ** 2 / length_sq
+            else:
+                d_sq = ex * ex + ey * ey
+            if d_sq > best:
+                best, best_k = d_sq, k
+        if best > tol_sq:
+            keep[best_k] = True
+            stack.append((i, best_k))
+            stack.append((best_k, j))
+
+    simplified = [ring[k] for k in range(n) if keep[k]]
+    return simplified if len(simplified) >= 3 else list(polygon)
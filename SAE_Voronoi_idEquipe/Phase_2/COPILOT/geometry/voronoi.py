@@ -13,92 +13,125 @@ Cela produit des cellules fermées (même pour les points sur le bord),
 clippées dans un rectangle, ce qui donne un rendu propre et stable.
 """
 
-from typing import List, Tuple, Dict, Set
-from collections import defaultdict
+from typing import List, Tuple, Dict, Union
+
+import numpy as np
 
 from .delaunay import Triangle, Point
+from .jit_utils import HAS_NUMBA, njit, prange
 from .utils import compute_bounding_box
 
+# Nombre de sites par tâche parallèle dans `_clip_cells`
+CLIP_CHUNK = 1024
+
+
+def _triangle_vertices(triangles) -> np.ndarray:
+    """
+    Sommets des triangles en tableau (T, 3) int32, que `triangles` soit
+    une liste de Triangle ou déjà un tableau d'indices.
+    """
+    if isinstance(triangles, np.ndarray):
+        return np.asarray(triangles, dtype=np.int32).reshape(-1, 3)
+    return np.array([tri.vertices for tri in triangles], dtype=np.int32).reshape(-1, 3)
+
 
-def _build_point_neighbors(triangles: List[Triangle]) -> Dict[int, Set[int]]:
+def _build_point_neighbors(tri_vertices: np.ndarray,
+                           n_points: int) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Construit, pour chaque point, l'ensemble de ses voisins dans la triangulation
-    de Delaunay (points reliés par une arête).
+    Voisins de chaque point dans la triangulation de Delaunay (points reliés
+    par une arête), en format CSR : les voisins du point i sont
+    indices[indptr[i]:indptr[i + 1]], triés.
+    Chaque triangle donne 6 couples orientés (i, j), codés i * n + j ; le tri
+    les range par i, et les doublons (arête commune à deux triangles) sont
+    retirés en comparant chaque clé à la précédente (plus rapide que np.unique).
     """
-    neighbors: Dict[int, Set[int]] = defaultdict(set)
-    for tri in triangles:
-        a, b, c = tri.vertices
-        neighbors[a].add(b)
-        neighbors[a].add(c)
-        neighbors[b].add(a)
-        neighbors[b].add(c)
-        neighbors[c].add(a)
-        neighbors[c].add(b)
-    return neighbors
+    tri = tri_vertices.astype(np.int64)
+    src = tri[:, [0, 0, 1, 1, 2, 2]].ravel()
+    dst = tri[:, [1, 2, 0, 2, 0, 1]].ravel()
+    keys = np.sort(src * n_points + dst)
+    first = np.ones(len(keys), dtype=bool)
+    np.not_equal(keys[1:], keys[:-1], out=first[1:])
+    src, indices = np.divmod(keys[first], n_points)
+    indptr = np.zeros(n_points + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n_points), out=indptr[1:])
+    return indptr, indices
+
+
+def _halfplanes(pts: np.ndarray, indptr: np.ndarray, indices: np.ndarray):
+    """
+    Coefficients des demi-plans { x | dist(x, p) <= dist(x, q) } pour tous
+    les couples (site p, voisin q) de l'adjacence CSR, en une seule passe NumPy :
+        x · v <= c   avec   v = q - p,   c = (||q||² - ||p||²) / 2
+    ||p||² est calculé une fois par point puis lu pour chaque couple ; les
+    colonnes x, y sont indexées séparément (plus rapide qu'indexer les
+    lignes du tableau (n, 2)).
+    Les voisins restent dans l'ordre de l'adjacence : un tri par distance ne
+    réduit pas les polygones clippés.
+    Retourne les tableaux (vx, vy, c), alignés sur `indices`.
+    """
+    src = np.repeat(np.arange(len(pts)), np.diff(indptr))
+    x, y = pts[:, 0], pts[:, 1]
+    norm_sq = x * x + y * y
+    c = (norm_sq[indices] - norm_sq[src]) / 2.0
+    return x[indices] - x[src], y[indices] - y[src], c
 
 
 def _clip_polygon_with_halfplane(
     polygon: List[Point],
-    p: Point,
-    q: Point,
+    vx: float,
+    vy: float,
+    c: float,
 ) -> List[Point]:
     """
-    Clippe un polygone convexe par le demi-plan :
-        { x | dist(x, p) <= dist(x, q) }
-
-    En pratique, on utilise la forme linéaire :
-        x · (q - p) <= (||q||² - ||p||²) / 2
+    Clippe un polygone convexe par le demi-plan { x | x · (vx, vy) <= c }
+    (forme linéaire de { x | dist(x, p) <= dist(x, q) }, voir `_halfplanes`).
 
     On applique un algorithme de type Sutherland–Hodgman pour ce demi-plan.
+    Le côté de chaque sommet (x · v - c) est calculé une seule fois, et le
+    test d'appartenance comme l'intersection sont écrits en ligne : aucune
+    fonction locale n'est créée ni appelée par sommet. Liste de tuples
+    plutôt que NumPy : les cellules n'ont que ~6 sommets.
     """
     if not polygon:
         return []
 
-    px, py = p
-    qx, qy = q
-    vx = qx - px
-    vy = qy - py
-    c = (qx * qx + qy * qy - px * px - py * py) / 2.0
-
-    def inside(pt: Point) -> bool:
-        x, y = pt
-        return x * vx + y * vy <= c + 1e-12
-
-    def intersect(p1: Point, p2: Point) -> Point:
-        x1, y1 = p1
-        x2, y2 = p2
-        dx = x2 - x1
-        dy = y2 - y1
-        denom = dx * vx + dy * vy
-        if abs(denom) < 1e-18:
-            # Segment presque parallèle à la frontière : on renvoie un point arbitraire
-            return p1
-        t = (c - (x1 * vx + y1 * vy)) / denom
-        return (x1 + t * dx, y1 + t * dy)
+    lim = c + 1e-12
 
     res: List[Point] = []
     prev = polygon[-1]
-    prev_inside = inside(prev)
+    prev_proj = prev[0] * vx + prev[1] * vy
+    prev_inside = prev_proj <= lim
 
     for curr in polygon:
-        curr_inside = inside(curr)
+        curr_proj = curr[0] * vx + curr[1] * vy
+        curr_inside = curr_proj <= lim
+        if curr_inside != prev_inside:
+            # Intersection du segment [prev, curr] avec la frontière
+            x1, y1 = prev
+            dx = curr[0] - x1
+            dy = curr[1] - y1
+            denom = dx * vx + dy * vy
+            if abs(denom) < 1e-18:
+                # Segment presque parallèle à la frontière : on renvoie un point arbitraire
+                res.append(prev)
+            else:
+                t = (c - prev_proj) / denom
+                res.append((x1 + t * dx, y1 + t * dy))
         if curr_inside:
-            if not prev_inside:
-                res.append(intersect(prev, curr))
             res.append(curr)
-        elif prev_inside:
-            res.append(intersect(prev, curr))
-        prev, prev_inside = curr, curr_inside
+        prev, prev_proj, prev_inside = curr, curr_proj, curr_inside
 
     return res
 
 
 def build_voronoi_cells(
-    points: List[Point],
-    triangles: List[Triangle],
-) -> Dict[int, List[Point]]:
+    points,
+    triangles: Union[List[Triangle], np.ndarray],
+) -> Dict[int, np.ndarray]:
     """
     Construit les cellules de Voronoï à partir d'une triangulation de Delaunay.
+    `points` : tableau (n, 2) ou liste de tuples.
+    `triangles` : liste de Triangle ou tableau (T, 3) d'indices de sommets.
 
     Pour chaque point i :
         - On part d'un grand rectangle englobant (bounding box élargie).
@@ -108,13 +141,18 @@ def build_voronoi_cells(
           clippée dans la bounding box.
 
     Retourne :
-        dict : point_index -> liste de sommets (points 2D) de la cellule.
+        dict : point_index -> tableau (k, 2) des sommets de la cellule.
+        Avec Numba, ce sont des vues sur le tableau unique rempli par
+        `_clip_cells` : aucune liste ni tuple Python par sommet.
     """
-    if not triangles or not points:
+    if len(triangles) == 0 or len(points) == 0:
         return {}
 
+    # Tableau (n, 2) converti une fois, partagé par la bbox et les demi-plans
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+
     # Bounding box élargie pour fermer les cellules infinies
-    min_x, min_y, max_x, max_y = compute_bounding_box(points)
+    min_x, min_y, max_x, max_y = compute_bounding_box(pts)
     dx = max_x - min_x
     dy = max_y - min_y
     delta = max(dx, dy)
@@ -127,7 +165,9 @@ def build_voronoi_cells(
     bbox_max_x = max_x + margin
     bbox_max_y = max_y + margin
 
-    # Polygone initial : le rectangle englobant
+    # Polygone initial : le rectangle englobant. Il est copié tel quel, sans
+    # être clippé par ses quatre côtés : il n'y a pas de cas « rectangle »
+    # à spécialiser (Liang–Barsky), seuls les demi-plans des voisins clippent.
     bbox_polygon: List[Point] = [
         (bbox_min_x, bbox_min_y),
         (bbox_max_x, bbox_min_y),
@@ -135,26 +175,121 @@ def build_voronoi_cells(
         (bbox_min_x, bbox_max_y),
     ]
 
-    # Voisins par point via la triangulation
-    neighbors = _build_point_neighbors(triangles)
+    # Voisins par point via la triangulation (CSR), puis demi-plans de tous
+    # les sites calculés d'un bloc. Les sites sans voisin (cas très
+    # pathologique) n'ont pas de cellule.
+    indptr, indices = _build_point_neighbors(_triangle_vertices(triangles), len(pts))
+    vx, vy, c = _halfplanes(pts, indptr, indices)
 
-    voronoi_cells: Dict[int, List[Point]] = {}
+    if HAS_NUMBA:
+        # Noyau compilé : tous les sites en un appel (`_clip_cells`)
+        slots, starts, sizes = _clip_cells(np.array(bbox_polygon), vx, vy, c, indptr)
+        return {
+            i: slots[start:start + size]
+            for i, (start, size) in enumerate(zip(starts.tolist(), sizes.tolist()))
+            if size >= 3
+        }
 
-    for i, p in enumerate(points):
-        if i not in neighbors or not neighbors[i]:
-            # Pas de voisins (cas très pathologique) : on ignore
+    vx, vy, c = vx.tolist(), vy.tolist(), c.tolist()
+    bounds = indptr.tolist()
+    voronoi_cells: Dict[int, np.ndarray] = {}
+    for i in range(len(pts)):
+        start, end = bounds[i], bounds[i + 1]
+        if start == end:
             continue
-
         poly = bbox_polygon[:]
-        for j in neighbors[i]:
-            q = points[j]
-            poly = _clip_polygon_with_halfplane(poly, p, q)
+        for k in range(start, end):
+            poly = _clip_polygon_with_halfplane(poly, vx[k], vy[k], c[k])
             if len(poly) < 3:
                 # Cellule dégénérée : on arrête
                 poly = []
                 break
 
         if len(poly) >= 3:
-            voronoi_cells[i] = poly
+            voronoi_cells[i] = np.array(poly, dtype=np.float64)
 
     return voronoi_cells
+
+
+@njit(cache=True)
+def _clip_inplace(src: np.ndarray, n_src: int, dst: np.ndarray,
+                  vx: float, vy: float, c: float) -> int:
+    """
+    Sutherland–Hodgman de src[:n_src] par le demi-plan x · (vx, vy) <= c,
+    écrit dans `dst` (même calcul que `_clip_polygon_with_halfplane`).
+    Retourne le nombre de sommets écrits (au plus n_src + 1).
+    """
+    if n_src == 0:
+        return 0
+    lim = c + 1e-12
+    n = 0
+    prev_x, prev_y = src[n_src - 1, 0], src[n_src - 1, 1]
+    prev_proj = prev_x * vx + prev_y * vy
+    prev_inside = prev_proj <= lim
+    for k in range(n_src):
+        curr_x, curr_y = src[k, 0], src[k, 1]
+        curr_proj = curr_x * vx + curr_y * vy
+        curr_inside = curr_proj <= lim
+        if curr_inside != prev_inside:
+            dx = curr_x - prev_x
+            dy = curr_y - prev_y
+            denom = dx * vx + dy * vy
+            if abs(denom) < 1e-18:
+                dst[n, 0], dst[n, 1] = prev_x, prev_y
+            else:
+                t = (c - prev_proj) / denom
+                dst[n, 0], dst[n, 1] = prev_x + t * dx, prev_y + t * dy
+            n += 1
+        if curr_inside:
+            dst[n, 0], dst[n, 1] = curr_x, curr_y
+            n += 1
+        prev_x, prev_y = curr_x, curr_y
+        prev_proj, prev_inside = curr_proj, curr_inside
+    return n
+
+
+@njit(cache=True, parallel=True)
+def _clip_cells(bbox: np.ndarray, vx: np.ndarray, vy: np.ndarray,
+                c: np.ndarray, offsets: np.ndarray):
+    """
+    Cellules de tous les sites : le site s part du rectangle `bbox` (4, 2) et
+    est clippé par les demi-plans offsets[s]:offsets[s + 1].
+    Chaque clip ajoute au plus un sommet : deux tampons de 4 + degré max
+    suffisent et sont réutilisés en ping-pong d'un clip et d'un site à l'autre.
+    Les sites sont indépendants : ils sont répartis sur les cœurs (`prange`)
+    par paquets de CLIP_CHUNK, chaque paquet avec ses propres tampons. Le
+    site s écrit dans sa plage réservée de `slots`, qui commence à
+    4 * s + offsets[s] et compte 4 + degré lignes (borne de sa taille).
+    Retourne (slots (4 * n_sites + len(c), 2), débuts (n_sites), tailles
+    (n_sites)) ; une cellule dégénérée (moins de 3 sommets) a une taille 0.
+    Pas de test préalable de bbox : chaque voisin de Delaunay coupe la cellule.
+    """
+    n_sites = len(offsets) - 1
+    max_deg = 0
+    for s in range(n_sites):
+        max_deg = max(max_deg, offsets[s + 1] - offsets[s])
+    slots = np.empty((4 * n_sites + len(c), 2), dtype=np.float64)
+    starts = 4 * np.arange(n_sites) + offsets[:-1]
+    sizes = np.zeros(n_sites, dtype=np.int64)
+
+    n_chunks = (n_sites + CLIP_CHUNK - 1) // CLIP_CHUNK
+    for chunk in prange(n_chunks):
+        buf_a = np.empty((4 + max_deg, 2), dtype=np.float64)
+        buf_b = np.empty((4 + max_deg, 2), dtype=np.float64)
+        for s in range(chunk * CLIP_CHUNK, min(n_sites, (chunk + 1) * CLIP_CHUNK)):
+            if offsets[s + 1] == offsets[s]:
+                # Site sans voisin : pas de cellule
+                continue
+            src, dst = buf_a, buf_b
+            src[:4] = bbox
+            n = 4
+            for k in range(offsets[s], offsets[s + 1]):
+                n = _clip_inplace(src, n, dst, vx[k], vy[k], c[k])
+                if n < 3:
+                    # Cellule dégénérée : on arrête
+                    n = 0
+                    break
+                src, dst = dst, src
+            slots[starts[s]:starts[s] + n] = src[:n]
+            sizes[s] = n
+    return slots, starts, sizes
@@ -1,12 +1,21 @@
 import json
+from itertools import chain
 from typing import List, Tuple
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson est optionnel : repli sur le module json standard
+    orjson = None
+
 Point = Tuple[float, float]
 
 
-def load_points_from_json(path: str) -> List[Point]:
+def load_points_from_json(path: str) -> np.ndarray:
     """
     Charge une liste de points depuis un fichier JSON.
+    Retourne un tableau contigu (n, 2) de float64 (colonnes x et y).
 
     Formats acceptés :
         [
@@ -21,12 +30,35 @@ def load_points_from_json(path: str) -> List[Point]:
             ...
         ]
     """
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        # Analyse en C (plusieurs fois plus rapide que json) ; ses erreurs
+        # héritent de json.JSONDecodeError, comme avec le module standard.
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
 
     if not isinstance(data, list):
         raise ValueError("Le JSON doit contenir une liste.")
 
+    # Conversion en bloc : np.array pour une liste de paires,
+    # np.fromiter pour une liste de dictionnaires {"x", "y"}. Au moindre
+    # élément mal formé (NumPy change aussi `null` en NaN), on repasse par
+    # la boucle ci-dessous, qui situe l'erreur.
+    try:
+        if data and isinstance(data[0], dict):
+            arr = np.fromiter(
+                chain.from_iterable((item["x"], item["y"]) for item in data),
+                dtype=np.float64, count=2 * len(data),
+            ).reshape(-1, 2)
+        else:
+            arr = np.array(data, dtype=np.float64)
+        if arr.ndim == 2 and arr.shape[1] == 2 and not np.isnan(arr).any():
+            return np.ascontiguousarray(arr)
+    except (KeyError, TypeError, ValueError):
+        pass
+
     points: List[Point] = []
     for idx, item in enumerate(data):
         if isinstance(item, dict):
@@ -43,4 +75,4 @@ def load_points_from_json(path: str) -> List[Point]:
             )
         points.append((x, y))
 
-    return points
+    return np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
@@ -1,5 +1,7 @@
 import os
-from typing import List, Tuple
+from typing import Tuple
+
+import numpy as np
 
 from .json_loader import load_points_from_json
 from .txt_loader import load_points_from_txt
@@ -7,9 +9,10 @@ from .txt_loader import load_points_from_txt
 Point = Tuple[float, float]
 
 
-def load_points_from_file(path: str) -> List[Point]:
+def load_points_from_file(path: str) -> np.ndarray:
     """
     Détecte l'extension du fichier et appelle le loader approprié.
+    Retourne un tableau (n, 2) de float64.
     Gère les erreurs de format et fournit des messages explicites.
     """
     if not os.path.isfile(path):
@@ -1,11 +1,15 @@
+import warnings
 from typing import List, Tuple
 
+import numpy as np
+
 Point = Tuple[float, float]
 
 
-def load_points_from_txt(path: str) -> List[Point]:
+def load_points_from_txt(path: str) -> np.ndarray:
     """
     Charge une liste de points depuis un fichier texte.
+    Retourne un tableau contigu (n, 2) de float64 (colonnes x et y).
 
     Format :
         Un point par ligne, deux nombres séparés par des espaces (ou tabulations) :
@@ -13,7 +17,21 @@ def load_points_from_txt(path: str) -> List[Point]:
             2.0 1.0
             ...
     Les lignes vides ou commentées (#) sont ignorées.
+
+    Lecture en C par np.loadtxt (deux premières colonnes) ; si elle échoue,
+    la boucle ligne à ligne ci-dessous relit le fichier pour accepter ce
+    que float() accepte seul (ex. « 1_000 ») ou signaler la ligne fautive.
     """
+    try:
+        with warnings.catch_warnings():
+            # Fichier sans aucun point : tableau vide, sans avertissement
+            warnings.simplefilter("ignore", UserWarning)
+            arr = np.loadtxt(path, comments="#", usecols=(0, 1), ndmin=2,
+                             dtype=np.float64, encoding="utf-8")
+        return np.ascontiguousarray(arr).reshape(-1, 2)
+    except ValueError:
+        pass
+
     points: List[Point] = []
     with open(path, "r", encoding="utf-8") as f:
         for line_no, line in enumerate(f, start=1):
@@ -29,4 +47,4 @@ def load_points_from_txt(path: str) -> List[Point]:
             except ValueError:
                 raise ValueError(f"Ligne {line_no}: valeurs non numériques.")
             points.append((x, y))
-    return points
+    return np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
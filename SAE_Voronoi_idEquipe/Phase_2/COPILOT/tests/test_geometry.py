@@ -7,8 +7,17 @@ Pour exécuter les tests :
 
 import math
 
-from geometry.utils import circumcircle, point_in_circumcircle
+import numpy as np
+import pytest
+
+from geometry.utils import (
+    circumcircle,
+    orientation,
+    point_in_circumcircle,
+    simplify_polygon,
+)
 from geometry.delaunay import compute_delaunay_triangulation
+from geometry.voronoi import build_voronoi_cells
 
 
 def test_circumcircle_equilateral():
@@ -40,6 +49,21 @@ def test_point_in_circumcircle():
     assert not point_in_circumcircle(outside_point, (cx, cy), r2)
 
 
+def test_orientation_signe():
+    assert orientation((0.0, 0.0), (1.0, 0.0), (0.0, 1.0)) > 0
+    assert orientation((0.0, 0.0), (0.0, 1.0), (1.0, 0.0)) < 0
+    assert orientation((0.0, 0.0), (1.0, 1.0), (2.0, 2.0)) == 0
+
+
+def test_simplify_polygon():
+    # Sommets presque alignés sur les côtés d'un carré : seuls les coins restent
+    square = [(0.0, 0.0), (0.5, 0.001), (1.0, 0.0), (1.0, 1.0), (0.5, 0.999), (0.0, 1.0)]
+    assert simplify_polygon(square, 0.01) == [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+    assert simplify_polygon(square, 0.0) == square
+    # Jamais moins de 3 sommets
+    assert len(simplify_polygon(square, 10.0)) >= 3
+
+
 def test_delaunay_simple_square():
     # Carré : 4 points
     points = [
@@ -56,3 +80,110 @@ def test_delaunay_simple_square():
     for t in tris:
         used_vertices.update(t.vertices)
     assert used_vertices == {0, 1, 2, 3}
+
+
+def test_delaunay_cercles_vides():
+    # Aucun point ne doit être strictement dans un cercle circonscrit
+    import random
+
+    rng = random.Random(0)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(200)]
+    tris = compute_delaunay_triangulation(points)
+    assert len(tris) > 0
+    for t in tris:
+        cx, cy = t.circumcenter
+        for i, (x, y) in enumerate(points):
+            if i in t.vertices:
+                continue
+            assert (x - cx) ** 2 + (y - cy) ** 2 >= t.radius_sq * (1 - 1e-9)
+
+
+def test_delaunay_voisins():
+    # Le voisin k d'un triangle partage son arête opposée au sommet k,
+    # et la relation est réciproque
+    import random
+
+    rng = random.Random(1)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(100)]
+    tris = compute_delaunay_triangulation(points)
+    for t_id, t in enumerate(tris):
+        for k, u_id in enumerate(t.neighbors):
+            if u_id == -1:
+                continue
+            edge = {t.vertices[(k + 1) % 3], t.vertices[(k + 2) % 3]}
+            assert edge <= set(tris[u_id].vertices)
+            assert t_id in tris[u_id].neighbors
+
+
+def _delaunay_cases():
+    # Aléatoire, grille, doublons, loin de l'origine
+    import random
+
+    rng = random.Random(2)
+    rand = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(300)]
+    return [
+        rand,
+        [(float(i), float(j)) for i in range(12) for j in range(12)],
+        rand[:100] + rand[:50],
+        [(x + 1e6, y + 1e6) for x, y in rand],
+    ]
+
+
+def _triangle_set(points):
+    return {tuple(sorted(t.vertices)) for t in compute_delaunay_triangulation(points)}
+
+
+def test_delaunay_chemin_python_identique(monkeypatch):
+    # Le chemin grille (`_watson_grid`, sans Numba) donne les mêmes triangles
+    # que le noyau compilé
+    import geometry.delaunay as delaunay
+
+    cases = _delaunay_cases()
+    expected = [_triangle_set(points) for points in cases]
+    monkeypatch.setattr(delaunay, "HAS_NUMBA", False)
+    for points, tris in zip(cases, expected):
+        assert _triangle_set(points) == tris
+
+
+def test_delaunay_balayage_parallele_identique(monkeypatch):
+    # Seuil abaissé : le test des cercles passe par `_mark_bad` (prange)
+    # presque dès le début, et les triangles ne changent pas
+    import geometry.delaunay as delaunay
+
+    if not delaunay.HAS_NUMBA:
+        pytest.skip("numba non installé")
+    cases = _delaunay_cases()
+    expected = [_triangle_set(points) for points in cases]
+    monkeypatch.setattr(delaunay, "PARALLEL_SCAN_MIN", 16)
+    for points, tris in zip(cases, expected):
+        assert _triangle_set(points) == tris
+
+
+def _voronoi_sample():
+    # Plus de CLIP_CHUNK sites : plusieurs paquets du noyau parallèle
+    points = np.random.default_rng(3).uniform(0, 100, (2500, 2))
+    return points, build_voronoi_cells(points, compute_delaunay_triangulation(points))
+
+
+def test_voronoi_chemin_python_identique(monkeypatch):
+    # Le noyau compilé (`_clip_cells`) et la boucle Python donnent les mêmes cellules
+    import geometry.voronoi as voronoi
+
+    points, cells = _voronoi_sample()
+    monkeypatch.setattr(voronoi, "HAS_NUMBA", False)
+    expected = build_voronoi_cells(points, compute_delaunay_triangulation(points))
+    assert cells.keys() == expected.keys()
+    for i, poly in cells.items():
+        assert poly.shape == expected[i].shape
+        assert np.allclose(poly, expected[i], rtol=0, atol=1e-9)
+
+
+def test_voronoi_site_dans_sa_cellule():
+    # Cellule convexe : le site est du même côté (intérieur) de toutes les arêtes
+    points, cells = _voronoi_sample()
+    assert len(cells) == len(points)
+    for i, poly in cells.items():
+        edges = np.roll(poly, -1, axis=0) - poly
+        to_site = points[i] - poly
+        cross = edges[:, 0] * to_site[:, 1] - edges[:, 1] * to_site[:, 0]
+        assert (cross > 0).all()
@@ -0,0 +1,82 @@
+"""
+Tests unitaires des chargeurs de points (TXT et JSON).
+
+Pour exécuter les tests :
+    python -m pytest tests/test_point_io.py
+"""
+
+import numpy as np
+import pytest
+
+import point_io.json_loader as json_loader
+from point_io.json_loader import load_points_from_json
+from point_io.txt_loader import load_points_from_txt
+
+
+def _write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+def test_txt_lecture_simple(tmp_path):
+    path = _write(tmp_path, "p.txt", "# points\n1.2 3.4\n\n2.0\t1.0\n")
+    pts = load_points_from_txt(path)
+    assert pts.dtype == np.float64 and pts.flags.c_contiguous
+    assert pts.tolist() == [[1.2, 3.4], [2.0, 1.0]]
+
+
+def test_txt_commentaires_seuls(tmp_path):
+    path = _write(tmp_path, "p.txt", "# aucun point\n# fin\n")
+    assert load_points_from_txt(path).shape == (0, 2)
+
+
+def test_txt_repli_ligne_a_ligne(tmp_path):
+    # « 1_000 » est refusé par np.loadtxt mais accepté par float()
+    path = _write(tmp_path, "p.txt", "1_000 2\n3 4\n")
+    assert load_points_from_txt(path).tolist() == [[1000.0, 2.0], [3.0, 4.0]]
+
+
+@pytest.mark.parametrize("content, message", [
+    ("1 2\n5\n", "Ligne 2: au moins deux valeurs"),
+    ("1 2\n# c\nabc 3\n", "Ligne 3: valeurs non numériques"),
+])
+def test_txt_ligne_invalide(tmp_path, content, message):
+    path = _write(tmp_path, "p.txt", content)
+    with pytest.raises(ValueError, match=message):
+        load_points_from_txt(path)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    # Les deux analyseurs : orjson (s'il est installé) et le module json standard
+    if request.param == "json":
+        monkeypatch.setattr(json_loader, "orjson", None)
+    elif json_loader.orjson is None:
+        pytest.skip("orjson non installé")
+
+
+@pytest.mark.parametrize("content", [
+    '[{"x": 1.2, "y": 3.4}, {"x": 2, "y": 1}]',
+    "[[1.2, 3.4], [2, 1]]",
+])
+def test_json_formats_dict_et_liste(tmp_path, json_backend, content):
+    pts = load_points_from_json(_write(tmp_path, "p.json", content))
+    assert pts.dtype == np.float64 and pts.flags.c_contiguous
+    assert pts.tolist() == [[1.2, 3.4], [2.0, 1.0]]
+
+
+@pytest.mark.parametrize("content", [
+    '[{"x": 1, "y": 2}, {"x": null, "y": 3}]',
+    "[[1, 2], [null, 3]]",
+])
+def test_json_null_refuse(tmp_path, json_backend, content):
+    # NumPy convertirait null en NaN : le repli doit lever une erreur
+    with pytest.raises(TypeError):
+        load_points_from_json(_write(tmp_path, "p.json", content))
+
+
+def test_json_element_invalide(tmp_path, json_backend):
+    path = _write(tmp_path, "p.json", '[[1, 2], {"x": 1}]')
+    with pytest.raises(ValueError, match="Élément 1"):
+        load_points_from_json(path)